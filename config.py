@@ -7,6 +7,9 @@ import sys
 
 # Database
 DATABASE_URL = os.environ.get("DATABASE_URL")
+DB_POOL_MIN = 2
+DB_POOL_MAX = 20
+DASHBOARD_CACHE_TTL = int(os.environ.get("DASHBOARD_CACHE_TTL", "30"))  # seconds dashboard aggregates are reused
 
 # Secrets
 SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key')
@@ -16,11 +19,31 @@ SLACK_WEBHOOK = os.environ.get("SLACK_WEBHOOK")
 GITHUB_CHECK_INTERVAL = 6 * 60 * 60
 MAIN_LOOP_SLEEP = 60
 GITHUB_RATE_LIMIT_SLEEP = 60
-REQUEST_DELAY = 1
+GITHUB_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # cached GitHub responses unused this long are pruned
+GITHUB_MAX_COMMIT_PAGES = 5  # pages of 100 commits fetched per repo per cycle
+GITHUB_MAX_COMMIT_DETAILS = 20  # per-commit file lookups per repo per cycle
+DOC_MAX_BYTES = 5_000_000  # doc page bodies are truncated beyond this
+ALERT_BUFFER_MAX_ROWS = 500  # buffered alerts are written once this many are queued
+
+# Parallel scanning (worker threads per monitor)
+GITHUB_MAX_WORKERS = int(os.environ.get("GITHUB_MAX_WORKERS", "20"))
+GITHUB_COMMIT_FILE_WORKERS = 5  # concurrent commit detail fetches within one repo
+PLAY_STORE_MAX_WORKERS = 4
+PLAY_STORE_LANG_WORKERS = 6
+PLAY_STORE_REQUESTS_PER_SECOND = 5  # shared across all Play Store workers
+PLAY_STORE_REPROBE_INTERVAL = 24 * 60 * 60  # listing languages re-probed at least this often
+DOCS_MAX_WORKERS = 8
+DOCS_PARSE_MAX_WORKERS = 4  # processes parsing doc HTML
+WEBHOOK_MAX_WORKERS = 8
+DISCOVERY_MAX_WORKERS = 5  # concurrent GitHub searches (search API allows 30/min)
 
 # Files and Directories
 DATA_DIR = "monitoring_data"
 LAST_COMMITS_FILE = os.path.join(DATA_DIR, "last_commits.json")
+DOC_HASHES_FILE = os.path.join(DATA_DIR, "doc_hashes.json")
+PLAY_STORE_LANGS_FILE = os.path.join(DATA_DIR, "play_store_langs.json")
+PREVIOUS_TEXTS_DIR = os.path.join(DATA_DIR, "previous_texts")
+STATE_DB_FILE = os.path.join(DATA_DIR, "state.db")
 WEBHOOKS_FILE = os.path.join(DATA_DIR, "webhooks.json")
 COMPANIES_FILE = "companies.yaml"
 
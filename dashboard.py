@@ -13,6 +13,7 @@ import yaml
 import config
 from datetime import datetime, timezone
 from monitors import discovery
+from monitors.common import http_session, get_headers, parse_json
 
 def friendly_time(dt):
     """Convert datetime to friendly format like '2 hours ago' or 'Dec 27'."""
@@ -86,12 +87,14 @@ def index():
     search_query = request.args.get('search', '')
     signal_type_filter = request.args.get('signal_type', '')
 
+    # The activity list renders no message bodies.
     alerts = storage.get_alerts(
         limit=500,
         source='github',
         company=company_filter if company_filter else None,
         search=search_query if search_query else None,
-        signal_type=signal_type_filter if signal_type_filter else None
+        signal_type=signal_type_filter if signal_type_filter else None,
+        columns=storage.ALERT_LIST_COLUMNS
     )
 
     for alert in alerts:
@@ -294,15 +297,13 @@ def api_quick_scan():
         'github': None
     }
 
-    import requests as http_requests
-
     if data.get('github_org'):
         try:
             org = data['github_org']
             url = f"https://api.github.com/orgs/{org}/repos?per_page=5&sort=updated"
-            resp = http_requests.get(url, timeout=10)
+            resp = http_session.get(url, headers=get_headers(), timeout=10)
             if resp.status_code == 200:
-                repos = resp.json()
+                repos = parse_json(resp)
                 results['github'] = {
                     'status': 'found',
                     'org': org,
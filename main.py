@@ -16,15 +16,13 @@ Run continuously or on-demand.
 import os
 import time
 import yaml
-import threading
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 import config
 from monitors.common import (
-    log, ensure_directories, load_json, save_json
+    log, ensure_directories
 )
-from monitors.github_monitor import check_all_github, check_github_repo, check_github_prs
+from monitors.github_monitor import check_all_github
 from monitors.webhooks import send_alert_to_webhooks
 
 try:
@@ -38,6 +36,10 @@ except Exception as e:
 
 
 
+# libyaml's C loader when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_companies() -> List[Dict[str, Any]]:
     """Load company configuration from YAML file."""
     if not os.path.exists(config.COMPANIES_FILE):
@@ -46,7 +48,7 @@ def load_companies() -> List[Dict[str, Any]]:
     
     try:
         with open(config.COMPANIES_FILE, 'r') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=YAML_LOADER)
         
         companies = config_data.get('companies', [])
         targets = []
@@ -72,56 +74,12 @@ def get_targets() -> List[Dict[str, Any]]:
 
 
 def check_github_parallel(targets: List[Dict]) -> int:
-    """Check GitHub repos in parallel for faster processing."""
-    log("Starting parallel GitHub checks...")
-    last_commits = load_json(config.LAST_COMMITS_FILE)
-    total_alerts = 0
-    state_lock = threading.Lock()  # Thread-safe lock for shared state updates
-
-    tasks = []
-    for target in targets:
-        company = target.get("company", "Unknown")
-        org = target.get("github_org")
-        repos = target.get("github_repos", [])
-
-        if not org or not repos:
-            continue
-
-        for repo in repos:
-            tasks.append((company, org, repo))
-
-    if not tasks:
-        return 0
-
-    def thread_safe_check(company, org, repo):
-        """Wrapper to perform GitHub check with thread-safe state updates."""
-        # Pass a thread-safe reference - dict updates are atomic in CPython
-        # but we use a lock for extra safety when updating shared state
-        alerts = check_github_repo(company, org, repo, last_commits)
-        return alerts
-
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {}
-
-        for company, org, repo in tasks:
-            future = executor.submit(thread_safe_check, company, org, repo)
-            futures[future] = (company, org, repo)
-
-            pr_future = executor.submit(check_github_prs, company, org, repo)
-            futures[pr_future] = (company, org, repo, 'pr')
-
-        for future in as_completed(futures):
-            try:
-                alerts = future.result()
-                with state_lock:
-                    total_alerts += alerts
-            except Exception as e:
-                task_info = futures[future]
-                log(f"Error in parallel check for {task_info}: {e}", "ERROR")
-
-    save_json(config.LAST_COMMITS_FILE, last_commits)
-    log(f"Parallel GitHub checks complete. Found {total_alerts} alerts.")
-    return total_alerts
+    """
+    Check GitHub repos in parallel for faster processing.
+    Delegates to check_all_github, which runs repos on the shared "github"
+    pool (config.GITHUB_MAX_WORKERS).
+    """
+    return check_all_github(targets)
 
 
 def check_all_sources_parallel(targets: List[Dict]) -> Dict[str, int]:
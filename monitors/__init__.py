@@ -6,7 +6,7 @@ Contains modular monitor implementations for different sources.
 from .github_monitor import check_github_repo, check_github_prs, check_all_github
 from .playstore_monitor import check_play_store_package, check_all_play_store
 from .docs_monitor import check_doc_url, check_all_docs
-from .webhooks import send_webhook, register_webhook, get_webhooks, send_alert_to_webhooks
+from .webhooks import send_webhook, register_webhook, get_webhooks, send_alert_to_webhooks, flush_webhooks
 from . import discovery
 
 __all__ = [
@@ -21,5 +21,6 @@ __all__ = [
     'register_webhook',
     'get_webhooks',
     'send_alert_to_webhooks',
+    'flush_webhooks',
     'discovery'
 ]
@@ -3,25 +3,100 @@ Shared utilities and configuration for monitors.
 """
 
 import os
+import re
+import sys
 import json
 import time
+import queue
+import atexit
 import logging
+import logging.handlers
+import threading
 import requests
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 import config
+from .state import state_get, state_set, state_prune
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] [%(levelname)s] %(message)s',
+try:
+    import storage
+    DB_AVAILABLE = True
+except Exception:
+    DB_AVAILABLE = False
+
+# Configure logging. Records go through a queue and are written by a
+# listener thread, so checker threads never block on stdout. Alert banners
+# (records logged with extra={"alert": True}) go to stdout unprefixed.
+def _is_alert_record(record: logging.LogRecord) -> bool:
+    return getattr(record, "alert", False)
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter(
+    '[%(asctime)s] [%(levelname)s] %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+_log_stream_handler.addFilter(lambda record: not _is_alert_record(record))
+_alert_stream_handler = logging.StreamHandler(sys.stdout)
+_alert_stream_handler.addFilter(_is_alert_record)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler, _alert_stream_handler)
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Slack notifications are posted by a background worker that batches
+# alerts raised close together into a single webhook payload.
+SLACK_BATCH_WINDOW = 0.2
+SLACK_BATCH_MAX = 20
+_slack_queue: "queue.Queue[str]" = queue.Queue(maxsize=1000)
+_slack_worker: Optional[threading.Thread] = None
+_slack_worker_lock = threading.Lock()
+
 
 
-_github_connection_cache = {"settings": None, "expires_at": None}
+# Connector token and the time.monotonic() deadline until which it is reused.
+_github_connection_cache = {"token": None, "deadline": 0.0}
+_github_connection_lock = threading.Lock()
+GITHUB_TOKEN_EXPIRY_MARGIN = 60
+# Reuse window for connector tokens that come without an expires_at.
+GITHUB_TOKEN_DEFAULT_LIFETIME = 50 * 60
+
+# Shared keep-alive session so repeated GitHub/doc/Slack calls reuse TLS connections.
+# Each host gets at most HTTP_MAX_CONNECTIONS_PER_HOST connections; extra
+# concurrent requests wait for a free one instead of opening throwaway
+# connections. Idempotent requests are retried with backoff on transient
+# errors and the final response is returned as-is.
+HTTP_MAX_CONNECTIONS_PER_HOST = 32
+http_session = requests.Session()
+
+def _make_adapter(status_forcelist: List[int]) -> HTTPAdapter:
+    return HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=HTTP_MAX_CONNECTIONS_PER_HOST,
+        pool_block=True,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=status_forcelist,
+            raise_on_status=False
+        )
+    )
+
+_http_adapter = _make_adapter([429, 500, 502, 503, 504])
+http_session.mount("https://", _http_adapter)
+http_session.mount("http://", _http_adapter)
+# GitHub rate limits (429) are retried by github_fetch, which waits as long as
+# GitHub asks; the adapter only retries server errors there.
+http_session.mount("https://api.github.com/", _make_adapter([500, 502, 503, 504]))
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
 def get_timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -32,22 +107,55 @@ def log(message: str, level: str = "INFO") -> None:
     logger.log(lvl, message)
 
 def alert(message: str) -> None:
-    print(f"\n{'='*60}")
-    print(f"[{get_timestamp()}] ALERT")
-    print(message)
-    print(f"{'='*60}\n")
+    logger.info(f"\n{'='*60}\n[{get_timestamp()}] ALERT\n{message}\n{'='*60}\n", extra={"alert": True})
     
-    slack_webhook = config.SLACK_WEBHOOK
-    if slack_webhook:
+    if config.SLACK_WEBHOOK:
+        _start_slack_worker()
+        try:
+            _slack_queue.put_nowait(f"[{get_timestamp()}] {message}")
+        except queue.Full:
+            log("Slack notification queue full, dropping alert", "WARNING")
+
+def _start_slack_worker() -> None:
+    global _slack_worker
+    with _slack_worker_lock:
+        if _slack_worker is None:
+            _slack_worker = threading.Thread(target=_slack_worker_loop, name="slack-notifier", daemon=True)
+            _slack_worker.start()
+            atexit.register(_slack_queue.join)
+
+def next_batch(q: queue.Queue, window: float, max_items: int) -> List[Any]:
+    """Block for one item, then collect any others arriving within the batch window."""
+    items = [q.get()]
+    deadline = time.monotonic() + window
+    while len(items) < max_items:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            items.append(q.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return items
+
+def _next_slack_batch() -> List[str]:
+    return next_batch(_slack_queue, SLACK_BATCH_WINDOW, SLACK_BATCH_MAX)
+
+def _slack_worker_loop() -> None:
+    while True:
+        messages = _next_slack_batch()
         try:
             payload = {
-                "text": f"[{get_timestamp()}] {message}",
+                "text": "\n\n".join(messages),
                 "username": "Localization Monitor",
                 "icon_emoji": ":globe_with_meridians:"
             }
-            requests.post(slack_webhook, json=payload, timeout=10)
+            post_json(config.SLACK_WEBHOOK, payload, timeout=10)
         except Exception as e:
             log(f"Failed to send Slack notification: {e}", "WARNING")
+        finally:
+            for _ in messages:
+                _slack_queue.task_done()
 
 def ensure_directories() -> None:
     os.makedirs(config.DATA_DIR, exist_ok=True)
@@ -58,50 +166,137 @@ def load_json(filepath: str) -> Dict:
         try:
             with open(filepath, 'r') as f:
                 return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             log(f"Error loading {filepath}: {e}", "WARNING")
     return {}
 
 def save_json(filepath: str, data: Dict) -> None:
+    """Write JSON atomically: a temp file in the same directory replaces the target."""
+    tmp_path = f"{filepath}.tmp"
     try:
-        with open(filepath, 'w') as f:
+        with open(tmp_path, 'w') as f:
             json.dump(data, f, indent=2)
-    except IOError as e:
+        os.replace(tmp_path, filepath)
+    except (TypeError, IOError) as e:
         log(f"Error saving {filepath}: {e}", "ERROR")
 
+@lru_cache(maxsize=16)
+def _compile_keywords(keywords: Tuple[str, ...]) -> Tuple[Optional[re.Pattern], Dict[str, FrozenSet[str]]]:
+    """
+    Build a single-pass matcher for a keyword list.
+    The lookahead alternation (longest first) finds the longest keyword starting
+    at each position; `contained` maps each keyword to every keyword that is a
+    substring of it, so overlapping hits (e.g. i18n inside i18next) are recovered.
+    """
+    lowered = sorted({kw.lower() for kw in keywords if kw}, key=len, reverse=True)
+    if not lowered:
+        return None, {}
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, lowered)) + "))")
+    contained = {kw: frozenset(other for other in lowered if other in kw) for kw in lowered}
+    return pattern, contained
+
 def contains_keywords(text: str, keywords: List[str] = None) -> List[str]:
     if keywords is None:
         keywords = config.KEYWORDS
-    text_lower = text.lower()
-    return [kw for kw in keywords if kw.lower() in text_lower]
+    pattern, contained = _compile_keywords(tuple(keywords))
+    found = {""}
+    if pattern is not None:
+        for hit in {match.group(1) for match in pattern.finditer(text.lower())}:
+            found |= contained[hit]
+    return [kw for kw in keywords if kw.lower() in found]
+
+# Path/author helpers are pure and see the same inputs across commits, so
+# they are memoized. Config values are part of the cache key so changes to
+# config (or patched config in tests) are respected.
 
 def is_bot_author(author: str) -> bool:
-    author_lower = author.lower()
-    return any(bot.lower() in author_lower for bot in config.BOT_PATTERNS)
+    return _is_bot_author(author, tuple(config.BOT_PATTERNS))
+
+@lru_cache(maxsize=32)
+def _compile_substrings(needles: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """One alternation matching any of the (lowercased) needles, or None if there are none."""
+    lowered = sorted({n.lower() for n in needles}, key=len, reverse=True)
+    if not lowered:
+        return None
+    return re.compile("|".join(map(re.escape, lowered)))
+
+@lru_cache(maxsize=8192)
+def _is_bot_author(author: str, bot_patterns: Tuple[str, ...]) -> bool:
+    pattern = _compile_substrings(bot_patterns)
+    return pattern is not None and pattern.search(author.lower()) is not None
 
 def is_localization_file(filepath: str) -> bool:
+    return _is_localization_file(filepath, tuple(config.LOCALIZATION_DIRS),
+                                 tuple(config.LOCALIZATION_FILE_PATTERNS))
+
+@lru_cache(maxsize=8192)
+def _is_localization_file(filepath: str, l10n_dirs: Tuple[str, ...],
+                          file_patterns: Tuple[str, ...]) -> bool:
     filepath_lower = filepath.lower()
-    in_l10n_dir = any(dir_pattern in filepath_lower for dir_pattern in config.LOCALIZATION_DIRS)
-    has_l10n_ext = any(filepath_lower.endswith(ext) for ext in config.LOCALIZATION_FILE_PATTERNS)
-    return in_l10n_dir and has_l10n_ext
+    dir_pattern = _compile_substrings(l10n_dirs)
+    in_l10n_dir = dir_pattern is not None and dir_pattern.search(filepath_lower) is not None
+    return in_l10n_dir and filepath_lower.endswith(file_patterns)
 
 def extract_language_from_file(filepath: str) -> Optional[str]:
+    return _extract_language_from_file(filepath, tuple(config.LANGUAGE_CODES))
+
+_PATH_SEGMENT_RE = re.compile(r"/([^/.]+)(?=[/.])")
+_VALUES_DIR_RE = re.compile(r"values-")
+
+@lru_cache(maxsize=16)
+def _language_code_index(language_codes: Tuple[str, ...]) -> Tuple[Dict[str, int], FrozenSet[int]]:
+    """Position of each code in the configured list, plus the distinct code lengths."""
+    index: Dict[str, int] = {}
+    for position, code in enumerate(language_codes):
+        index.setdefault(code, position)
+    return index, frozenset(len(code) for code in index)
+
+@lru_cache(maxsize=8192)
+def _extract_language_from_file(filepath: str, language_codes: Tuple[str, ...]) -> Optional[str]:
     filepath_lower = filepath.lower()
     filename = os.path.basename(filepath_lower)
     name_without_ext = os.path.splitext(filename)[0]
+    index, lengths = _language_code_index(language_codes)
     
-    for code in config.LANGUAGE_CODES:
-        if name_without_ext == code or name_without_ext.endswith(f"_{code}") or name_without_ext.endswith(f"-{code}"):
-            return code
-        if f"/{code}/" in filepath_lower or f"/{code}." in filepath_lower:
-            return code
-        if f"values-{code}" in filepath_lower:
-            return code
-    return None
+    # Collect every substring that could satisfy a rule, then look them up:
+    # name == code, name ends with _code/-code, /code/ or /code. in the path,
+    # or values-code. The code listed first in config wins, as before.
+    candidates = {name_without_ext}
+    candidates.update(name_without_ext[i + 1:] for i, c in enumerate(name_without_ext) if c in "_-")
+    candidates.update(m.group(1) for m in _PATH_SEGMENT_RE.finditer(filepath_lower))
+    for m in _VALUES_DIR_RE.finditer(filepath_lower):
+        candidates.update(filepath_lower[m.end():m.end() + n] for n in lengths)
+    
+    positions = [index[c] for c in candidates if c in index]
+    return language_codes[min(positions)] if positions else None
+
+class _FilenameTable(dict):
+    """str.translate table: alphanumerics, '-' and '_' kept, anything else '_'."""
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in '-_' else ord('_')
+        self[codepoint] = value
+        return value
+
+_FILENAME_TABLE = _FilenameTable()
 
+@lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
     """Create a safe filename from a string."""
-    return "".join(c if c.isalnum() or c in '-_' else '_' for c in name)
+    return name.translate(_FILENAME_TABLE)
+
+def _seconds_until(timestamp: Optional[str]) -> float:
+    """Seconds from now until an ISO-8601 timestamp; 0 if missing or unparseable."""
+    if not timestamp:
+        return 0.0
+    try:
+        expires = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=timezone.utc)
+        return max(0.0, (expires - datetime.now(timezone.utc)).total_seconds())
+    except ValueError:
+        return 0.0
 
 def get_github_access_token() -> Optional[str]:
     if os.environ.get("GITHUB_TOKEN"):
@@ -124,35 +319,38 @@ def get_github_access_token() -> Optional[str]:
         return None
     
     cached = _github_connection_cache
-    if cached["settings"] and cached["expires_at"]:
-        try:
-            if datetime.fromisoformat(cached["expires_at"].replace("Z", "+00:00")) > datetime.now():
-                return cached["settings"].get("access_token")
-        except:
-            pass
+    if cached["token"] and time.monotonic() < cached["deadline"]:
+        return cached["token"]
     
-    try:
-        response = requests.get(
-            f"https://{hostname}/api/v2/connection?include_secrets=true&connector_names=github",
-            headers={
-                "Accept": "application/json",
-                "X_REPLIT_TOKEN": x_replit_token
-            },
-            timeout=10
-        )
-        response.raise_for_status()
-        data = response.json()
-        connection = data.get("items", [{}])[0]
-        settings = connection.get("settings", {})
-        
-        access_token = settings.get("access_token") or settings.get("oauth", {}).get("credentials", {}).get("access_token")
+    # One worker refreshes the token; the others wait and reuse it.
+    with _github_connection_lock:
+        if cached["token"] and time.monotonic() < cached["deadline"]:
+            return cached["token"]
         
-        if access_token:
-            _github_connection_cache["settings"] = settings
-            _github_connection_cache["expires_at"] = settings.get("expires_at")
-            return access_token
-    except Exception as e:
-        log(f"Error fetching GitHub connection: {e}", "WARNING")
+        try:
+            response = http_session.get(
+                f"https://{hostname}/api/v2/connection?include_secrets=true&connector_names=github",
+                headers={
+                    "Accept": "application/json",
+                    "X_REPLIT_TOKEN": x_replit_token
+                },
+                timeout=10
+            )
+            response.raise_for_status()
+            data = response.json()
+            connection = data.get("items", [{}])[0]
+            settings = connection.get("settings", {})
+            
+            access_token = settings.get("access_token") or settings.get("oauth", {}).get("credentials", {}).get("access_token")
+            
+            if access_token:
+                cached["token"] = access_token
+                expires_at = settings.get("expires_at")
+                lifetime = _seconds_until(expires_at) if expires_at else GITHUB_TOKEN_DEFAULT_LIFETIME
+                cached["deadline"] = time.monotonic() + lifetime - GITHUB_TOKEN_EXPIRY_MARGIN
+                return access_token
+        except Exception as e:
+            log(f"Error fetching GitHub connection: {e}", "WARNING")
     
     return None
 
@@ -165,3 +363,258 @@ def get_headers() -> Dict[str, str]:
     if github_token:
         headers["Authorization"] = f"token {github_token}"
     return headers
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body."""
+    return json.loads(response.content)
+
+def post_json(url: str, payload: Any, headers: Optional[Dict] = None, timeout: int = 10) -> requests.Response:
+    """POST a JSON body on the shared (pooled) session."""
+    return http_session.post(url, json=payload, headers=headers, timeout=timeout)
+
+GITHUB_RATE_LIMIT_WARNING = 500
+GITHUB_RATE_LIMIT_FLOOR = 100
+
+def check_rate_limit(response: requests.Response) -> None:
+    """
+    Track the GitHub rate limit budget from a response's headers.
+    Warns when it runs low, and once fewer than GITHUB_RATE_LIMIT_FLOOR
+    requests remain (scaled down for small budgets such as search's 30/min)
+    sleeps until the window resets. Callers need no fixed per-request delay.
+    """
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining is None or not remaining.isdigit():
+        return
+    remaining = int(remaining)
+    limit = response.headers.get("X-RateLimit-Limit", "")
+    limit = int(limit) if limit.isdigit() else None
+    
+    warning = min(GITHUB_RATE_LIMIT_WARNING, limit // 10) if limit else GITHUB_RATE_LIMIT_WARNING
+    if remaining < warning:
+        log(f"GitHub rate limit low: {remaining} requests remaining", "WARNING")
+    
+    floor = min(GITHUB_RATE_LIMIT_FLOOR, max(1, limit // 10)) if limit else GITHUB_RATE_LIMIT_FLOOR
+    reset = response.headers.get("X-RateLimit-Reset", "")
+    if remaining < floor and reset.isdigit():
+        delay = int(reset) - time.time()
+        if delay > 0:
+            log(f"GitHub rate limit nearly exhausted, waiting {int(delay)}s for reset", "WARNING")
+            time.sleep(delay)
+
+GITHUB_MAX_RETRIES = 3
+
+def rate_limit_delay(response: requests.Response, attempt: int = 0) -> Optional[float]:
+    """
+    Seconds to wait before retrying a rate-limited GitHub response, following
+    GitHub's guidance: Retry-After if sent, else the primary limit's reset
+    time, else an exponential backoff for secondary limits.
+    Returns None when the response is not rate limited.
+    """
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    reset = response.headers.get("X-RateLimit-Reset", "")
+    if response.headers.get("X-RateLimit-Remaining") == "0" and reset.isdigit():
+        return max(0.0, int(reset) - time.time())
+    if "rate limit" in response.text.lower():
+        return float(config.GITHUB_RATE_LIMIT_SLEEP * 2 ** attempt)
+    return None
+
+def github_fetch(url: str, **kwargs) -> requests.Response:
+    """
+    GET a GitHub API URL on the shared session, tracking the rate limit budget.
+    Rate-limited responses are retried up to GITHUB_MAX_RETRIES times after
+    the wait GitHub asks for; the last response is returned either way.
+    """
+    for attempt in range(GITHUB_MAX_RETRIES + 1):
+        response = http_session.get(url, **kwargs)
+        if response.status_code == 304:
+            return response
+        check_rate_limit(response)
+        delay = rate_limit_delay(response, attempt)
+        if delay is None or attempt == GITHUB_MAX_RETRIES:
+            return response
+        log(f"GitHub rate limited ({response.status_code}), retrying in {int(delay)}s", "WARNING")
+        time.sleep(delay)
+    return response
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+def _cache_expiry(response: requests.Response) -> float:
+    """Wall-clock time until which a response is fresh per its Cache-Control max-age."""
+    match = _MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+    return time.time() + int(match.group(1)) if match else 0.0
+
+def prune_github_cache(max_age: float = config.GITHUB_CACHE_MAX_AGE) -> int:
+    """Drop cached GitHub responses last stored more than `max_age` seconds ago."""
+    return state_prune("github_etags", "stored", time.time() - max_age)
+
+def github_get(url: str, params: Optional[Dict] = None, timeout: int = 30) -> Tuple[int, Any]:
+    """
+    Conditional GET against the GitHub API.
+    The ETag and decoded body of each 200 response are kept in the state store,
+    keyed by full URL. While the response is fresh (Cache-Control max-age) it
+    is served without a request; after that, calls send If-None-Match and a
+    304 (which costs no rate limit) is served from the cache.
+    Search URLs embed moving date thresholds and are never cached; other
+    entries are dropped by prune_github_cache once unused for a while.
+    Returns (status_code, data); data is None for non-200 responses.
+    """
+    if "/search/" in url:
+        response = github_fetch(url, headers=get_headers(), params=params, timeout=timeout)
+        if response.status_code != 200:
+            return response.status_code, None
+        return 200, parse_json(response)
+
+    cache_key = requests.Request('GET', url, params=params).prepare().url
+    cached = state_get("github_etags", cache_key)
+    if cached and cached.get("expires", 0) > time.time():
+        return 200, cached["body"]
+    
+    headers = get_headers()
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    
+    response = github_fetch(url, headers=headers, params=params, timeout=timeout)
+    
+    if response.status_code == 304 and cached:
+        state_set("github_etags", cache_key, {
+            **cached, "expires": _cache_expiry(response), "stored": time.time()
+        })
+        return 200, cached["body"]
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    data = parse_json(response)
+    if response.headers.get("ETag"):
+        state_set("github_etags", cache_key, {
+            "etag": response.headers["ETag"],
+            "body": data,
+            "expires": _cache_expiry(response),
+            "stored": time.time()
+        })
+    return 200, data
+
+def github_graphql(query: str, variables: Optional[Dict] = None) -> Optional[Dict]:
+    """
+    Run a GitHub GraphQL query and return its `data` payload.
+    Returns None when no token is configured (GraphQL requires auth) or the
+    request fails, so callers can fall back to REST.
+    """
+    headers = get_headers()
+    if "Authorization" not in headers:
+        return None
+
+    try:
+        response = post_json(
+            GITHUB_GRAPHQL_URL,
+            {"query": query, "variables": variables or {}},
+            headers=headers,
+            timeout=30
+        )
+        response.raise_for_status()
+        payload = parse_json(response)
+        if payload.get("errors"):
+            log(f"GitHub GraphQL errors: {payload['errors']}", "WARNING")
+        return payload.get("data")
+    except Exception as e:
+        log(f"GitHub GraphQL request failed: {e}", "WARNING")
+        return None
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls to at most `rate` per second.
+    Replaces per-target time.sleep() so parallel workers share one budget.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Long-lived worker pools, one per monitor, reused across cycles.
+_pools: Dict[str, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Return the named shared pool, creating it on first use."""
+    with _pools_lock:
+        if name not in _pools:
+            _pools[name] = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=name)
+        return _pools[name]
+
+def _shutdown_pools() -> None:
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False)
+        _pools.clear()
+
+atexit.register(_shutdown_pools)
+
+def run_parallel(fn: Callable[[Any], Any], items: Iterable, max_workers: int, pool: Optional[str] = None) -> List:
+    """
+    Run fn over items on a bounded thread pool, returning results in input order.
+    With `pool`, the work runs on that long-lived shared pool instead of a
+    per-call one. Tasks on a shared pool must not wait on work submitted to
+    the same pool, so nested calls use a different name.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if pool:
+        return list(get_pool(pool, max_workers).map(fn, items))
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        return list(executor.map(fn, items))
+
+
+class AlertBuffer:
+    """
+    Collects alert rows during a monitoring cycle and writes them to the
+    database in one batch on flush(), instead of one INSERT per alert.
+    A cycle that buffers max_rows alerts is flushed early, so a large
+    backfill is written in bounded batches rather than held until the end.
+    """
+
+    def __init__(self, max_rows: int = config.ALERT_BUFFER_MAX_ROWS):
+        self._rows: List[Dict] = []
+        self._lock = threading.Lock()
+        self.max_rows = max_rows
+
+    def add(self, source: str, company: str, title: str, message: str,
+            keywords: List[str], url: str, metadata: Optional[Dict] = None) -> None:
+        with self._lock:
+            self._rows.append({
+                "source": source, "company": company, "title": title,
+                "message": message, "keywords": keywords, "url": url,
+                "metadata": metadata
+            })
+            full = len(self._rows) >= self.max_rows
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered alerts to the database. Returns the number saved."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows or not DB_AVAILABLE:
+            return 0
+        try:
+            return storage.save_alerts_bulk(rows)
+        except Exception as e:
+            log(f"Failed to save {len(rows)} alerts to database: {e}", "WARNING")
+            return 0
+
+
+alert_buffer = AlertBuffer()
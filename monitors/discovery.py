@@ -12,18 +12,18 @@ Features:
 """
 
 import os
-import time
 import json
-import requests
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import config
 from .common import (
-    log, get_headers, is_localization_file, extract_language_from_file,
-    contains_keywords, load_json, save_json
+    log, github_get, github_graphql, prune_github_cache, run_parallel, is_localization_file, extract_language_from_file,
+    contains_keywords
 )
+from .state import load_state, save_state
 
 # Industry taxonomy for similar company recommendations
 INDUSTRY_TAXONOMY = {
@@ -69,6 +69,34 @@ INDUSTRY_TAXONOMY = {
     },
 }
 
+# Lookup tables derived from the taxonomy once at import, in taxonomy order.
+_INDUSTRY_ORDER = {industry: i for i, industry in enumerate(INDUSTRY_TAXONOMY)}
+_COMPANY_TO_INDUSTRY: Dict[str, str] = {}
+for _industry, _data in INDUSTRY_TAXONOMY.items():
+    for _company in _data['companies']:
+        _COMPANY_TO_INDUSTRY.setdefault(_company.lower(), _industry)
+_KEYWORD_TO_INDUSTRIES: Dict[str, List[str]] = {}
+for _industry, _data in INDUSTRY_TAXONOMY.items():
+    for _keyword in _data['keywords']:
+        _KEYWORD_TO_INDUSTRIES.setdefault(_keyword, []).append(_industry)
+_INDUSTRY_KEYWORDS = list(_KEYWORD_TO_INDUSTRIES)
+_TAXONOMY_COMPANIES = [company for data in INDUSTRY_TAXONOMY.values() for company in data['companies']]
+
+
+def _keyword_industries(text: str) -> List[str]:
+    """Industries (in taxonomy order) with a keyword contained in text, found in one regex pass."""
+    found = set()
+    for keyword in contains_keywords(text, _INDUSTRY_KEYWORDS):
+        found.update(_KEYWORD_TO_INDUSTRIES[keyword])
+    return sorted(found, key=_INDUSTRY_ORDER.get)
+
+
+def _keyword_industry(text: str) -> Optional[str]:
+    """First industry (in taxonomy order) with a keyword contained in text."""
+    industries = _keyword_industries(text)
+    return industries[0] if industries else None
+
+
 # Popular i18n libraries to track
 I18N_LIBRARIES = [
     'i18next', 'react-intl', 'formatjs', 'vue-i18n', 'ngx-translate',
@@ -76,28 +104,159 @@ I18N_LIBRARIES = [
     'typesafe-i18n', 'lingui', 'rosetta', 'next-intl', 'paraglide-js'
 ]
 
-# Discovery data cache file
+# Legacy JSON caches; suggestions are now kept in the state store and
+# SUGGESTIONS_FILE is only read once to import an existing cache.
 DISCOVERY_CACHE_FILE = os.path.join(config.DATA_DIR, "discovery_cache.json")
 SUGGESTIONS_FILE = os.path.join(config.DATA_DIR, "suggestions.json")
 
 
-def get_github_headers():
-    """Get headers for GitHub API requests."""
-    headers = {'Accept': 'application/vnd.github.v3+json'}
-    github_token = os.environ.get('GITHUB_TOKEN')
-    if github_token:
-        headers['Authorization'] = f'token {github_token}'
-    return headers
+# GitHub rejects search queries longer than 256 characters; leave room for
+# the sort qualifier appended for GraphQL searches.
+GITHUB_SEARCH_QUERY_MAX = 256 - len(" sort:updated-desc")
+
+
+def exclude_orgs_from_query(query: str, orgs: Iterable[str]) -> str:
+    """Append -user: qualifiers for `orgs`, as many as fit in GitHub's query length limit."""
+    for org in orgs:
+        clause = f" -user:{org}"
+        if len(query) + len(clause) > GITHUB_SEARCH_QUERY_MAX:
+            break
+        query += clause
+    return query
 
 
 # ============================================================
 # 1. TRENDING I18N REPOS
 # ============================================================
 
-def search_trending_i18n_repos(days: int = 7, min_stars: int = 100) -> List[Dict]:
+REPO_SEARCH_FIELDS = """
+    ... on Repository {
+        nameWithOwner name description url updatedAt stargazerCount
+        owner { login }
+        primaryLanguage { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+    }
+"""
+
+
+PR_SEARCH_FIELDS = """
+    ... on PullRequest {
+        databaseId title url createdAt state
+        author { login }
+        repository { nameWithOwner }
+    }
+"""
+
+
+def _search_graphql(queries: List[str], search_type: str, fields: str, first: int) -> Optional[List[List[Dict]]]:
+    """
+    Run several searches in a single aliased GraphQL request.
+    Returns the result nodes per query, or None when GraphQL is unavailable
+    (no token or request failed).
+    """
+    if not queries:
+        return []
+
+    variables = {f"q{i}": query for i, query in enumerate(queries)}
+    declarations = ", ".join(f"${name}: String!" for name in variables)
+    searches = " ".join(
+        f"{name}: search(query: ${name}, type: {search_type}, first: {int(first)}) {{ nodes {{ {fields} }} }}"
+        for name in variables
+    )
+    data = github_graphql(f"query({declarations}) {{ {searches} }}", variables)
+    if data is None:
+        return None
+    return [[node for node in ((data.get(name) or {}).get('nodes') or []) if node] for name in variables]
+
+
+def search_repos_graphql(queries: List[str], first: int = 30) -> Optional[List[List[Dict]]]:
+    """
+    Run several repository searches in a single aliased GraphQL request.
+    Returns one list per query of repos shaped like REST search items, or
+    None when GraphQL is unavailable (no token or request failed).
+    """
+    node_lists = _search_graphql(queries, "REPOSITORY", REPO_SEARCH_FIELDS, first)
+    if node_lists is None:
+        return None
+
+    batches = []
+    for nodes in node_lists:
+        items = []
+        for node in nodes:
+            if not node.get('nameWithOwner'):
+                continue
+            items.append({
+                'full_name': node['nameWithOwner'],
+                'name': node['name'],
+                'owner': {'login': (node.get('owner') or {}).get('login', '')},
+                'description': node.get('description'),
+                'stargazers_count': node.get('stargazerCount', 0),
+                'language': (node.get('primaryLanguage') or {}).get('name'),
+                'html_url': node.get('url'),
+                'updated_at': node.get('updatedAt'),
+                'topics': [t['topic']['name'] for t in (node.get('repositoryTopics') or {}).get('nodes', [])]
+            })
+        batches.append(items)
+    return batches
+
+
+def search_prs_graphql(queries: List[str], first: int = 30) -> Optional[List[List[Dict]]]:
+    """
+    Run several pull request searches in a single aliased GraphQL request.
+    Returns one list per query of PRs shaped like REST issue search items,
+    or None when GraphQL is unavailable.
+    """
+    node_lists = _search_graphql(queries, "ISSUE", PR_SEARCH_FIELDS, first)
+    if node_lists is None:
+        return None
+
+    batches = []
+    for nodes in node_lists:
+        items = []
+        for node in nodes:
+            if not node.get('databaseId') or not node.get('repository'):
+                continue
+            items.append({
+                'id': node['databaseId'],
+                'title': node.get('title', ''),
+                'html_url': node.get('url'),
+                'repository_url': f"https://api.github.com/repos/{node['repository']['nameWithOwner']}",
+                'user': {'login': (node.get('author') or {}).get('login', '')},
+                'created_at': node.get('createdAt'),
+                'state': (node.get('state') or '').lower()
+            })
+        batches.append(items)
+    return batches
+
+
+def search_repos_rest(query: str, per_page: int = 30) -> List[Dict]:
+    """Run one REST repository search, sorted by most recently updated."""
+    try:
+        url = "https://api.github.com/search/repositories"
+        params = {
+            'q': query,
+            'sort': 'updated',
+            'order': 'desc',
+            'per_page': per_page
+        }
+
+        status, data = github_get(url, params=params, timeout=30)
+
+        if status == 403:
+            log("GitHub rate limit hit for repository search", "WARNING")
+            return []
+        return data.get('items', []) if status == 200 else []
+
+    except Exception as e:
+        log(f"Error in repository search: {e}", "WARNING")
+        return []
+
+
+def search_trending_i18n_repos(days: int = 7, min_stars: int = 100, exclude_orgs: Iterable[str] = ()) -> List[Dict]:
     """
     Search for trending repos with recent i18n activity.
     Uses GitHub search API to find repos with localization-related commits.
+    Repos owned by `exclude_orgs` are left out of the search itself.
     """
     results = []
     date_threshold = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
@@ -109,49 +268,32 @@ def search_trending_i18n_repos(days: int = 7, min_stars: int = 100) -> List[Dict
         f'path:locales pushed:>{date_threshold} stars:>{min_stars}',
         f'path:translations pushed:>{date_threshold} stars:>{min_stars}',
     ]
+    search_queries = [exclude_orgs_from_query(query, exclude_orgs) for query in search_queries]
 
     seen_repos = set()
 
-    for query in search_queries:
-        try:
-            url = "https://api.github.com/search/repositories"
-            params = {
-                'q': query,
-                'sort': 'updated',
-                'order': 'desc',
-                'per_page': 30
-            }
-
-            response = requests.get(url, headers=get_github_headers(), params=params, timeout=30)
-
-            if response.status_code == 403:
-                log("GitHub rate limit hit for trending search", "WARNING")
-                time.sleep(60)
-                continue
+    # One aliased GraphQL request for all queries; REST search per query without a token.
+    batches = search_repos_graphql([f"{query} sort:updated-desc" for query in search_queries])
+    if batches is None:
+        batches = [search_repos_rest(query) for query in search_queries]
 
-            if response.status_code == 200:
-                data = response.json()
-                for repo in data.get('items', []):
-                    repo_key = repo['full_name']
-                    if repo_key not in seen_repos:
-                        seen_repos.add(repo_key)
-                        results.append({
-                            'full_name': repo['full_name'],
-                            'name': repo['name'],
-                            'owner': repo['owner']['login'],
-                            'description': repo.get('description', ''),
-                            'stars': repo['stargazers_count'],
-                            'language': repo.get('language', ''),
-                            'url': repo['html_url'],
-                            'updated_at': repo['updated_at'],
-                            'topics': repo.get('topics', []),
-                            'source': 'trending'
-                        })
-
-            time.sleep(config.REQUEST_DELAY)
-
-        except Exception as e:
-            log(f"Error in trending search: {e}", "WARNING")
+    for items in batches:
+        for repo in items:
+            repo_key = repo['full_name']
+            if repo_key not in seen_repos:
+                seen_repos.add(repo_key)
+                results.append({
+                    'full_name': repo['full_name'],
+                    'name': repo['name'],
+                    'owner': repo['owner']['login'],
+                    'description': repo.get('description', ''),
+                    'stars': repo['stargazers_count'],
+                    'language': repo.get('language', ''),
+                    'url': repo['html_url'],
+                    'updated_at': repo['updated_at'],
+                    'topics': repo.get('topics', []),
+                    'source': 'trending'
+                })
 
     # Sort by stars
     results.sort(key=lambda x: x['stars'], reverse=True)
@@ -174,26 +316,31 @@ def get_repo_i18n_signals(owner: str, repo: str) -> Dict:
         # Check repo contents for common i18n paths
         i18n_paths = ['locales', 'locale', 'i18n', 'translations', 'lang', 'languages']
 
+        # Most common layouts first; probing stops at the first path that
+        # exists, so a typical repo costs one or two requests. The caller
+        # already checks repos in parallel.
+        contents = None
         for path in i18n_paths:
-            url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
-            response = requests.get(url, headers=get_github_headers(), timeout=15)
-
-            if response.status_code == 200:
-                signals['has_locales'] = True
-                contents = response.json()
-
-                for item in contents:
-                    if item['type'] == 'file':
-                        filename = item['name']
-                        signals['i18n_files'].append(filename)
-                        lang = extract_language_from_file(filename)
-                        if lang and lang not in signals['languages']:
-                            signals['languages'].append(lang)
-
-                signals['signal_strength'] = min(len(signals['languages']) * 10, 100)
+            status, data = github_get(f"https://api.github.com/repos/{owner}/{repo}/contents/{path}", timeout=15)
+            if status == 200:
+                contents = data
                 break
 
-            time.sleep(0.5)
+        if contents is not None:
+            signals['has_locales'] = True
+            languages = set()
+
+            for item in contents:
+                if item['type'] == 'file':
+                    filename = item['name']
+                    signals['i18n_files'].append(filename)
+                    lang = extract_language_from_file(filename)
+                    if lang:
+                        languages.add(lang)
+
+            signals['languages'] = sorted(languages)
+
+            signals['signal_strength'] = min(len(signals['languages']) * 10, 100)
 
     except Exception as e:
         log(f"Error checking i18n signals for {owner}/{repo}: {e}", "WARNING")
@@ -201,14 +348,14 @@ def get_repo_i18n_signals(owner: str, repo: str) -> Dict:
     return signals
 
 
-def discover_trending_i18n_companies() -> List[Dict]:
+def discover_trending_i18n_companies(exclude_orgs: Iterable[str] = ()) -> List[Dict]:
     """
     Main function to discover trending repos with i18n activity.
     Returns list of company suggestions.
     """
     log("Discovering trending i18n repos...")
 
-    trending_repos = search_trending_i18n_repos()
+    trending_repos = search_trending_i18n_repos(exclude_orgs=exclude_orgs)
     suggestions = []
 
     for repo in trending_repos[:20]:
@@ -231,8 +378,6 @@ def discover_trending_i18n_companies() -> List[Dict]:
                 'reason': f"Trending repo with {len(signals['languages'])} languages detected"
             })
 
-        time.sleep(config.REQUEST_DELAY)
-
     log(f"Found {len(suggestions)} trending i18n repos")
     return suggestions
 
@@ -241,44 +386,57 @@ def discover_trending_i18n_companies() -> List[Dict]:
 # 2. SIMILAR COMPANIES RECOMMENDATIONS
 # ============================================================
 
-def get_company_industry(company_name: str, github_org: str = None) -> Optional[str]:
+@lru_cache(maxsize=2048)
+def fetch_org(github_org: str) -> Dict:
     """
-    Determine a company's industry based on their name, org, and repo topics.
+    GitHub org info, fetched once per process (run_full_discovery clears it).
+    Raises LookupError when the org can't be fetched, so failures aren't cached.
     """
+    status, org_data = github_get(f"https://api.github.com/orgs/{github_org}", timeout=15)
+    if status != 200:
+        raise LookupError(f"GitHub org {github_org} returned {status}")
+    return org_data
+
+
+@lru_cache(maxsize=2048)
+def _name_industry(company_name: str) -> Optional[str]:
+    """Industry implied by the company name alone (taxonomy entry or keyword)."""
     company_lower = company_name.lower()
 
-    # Direct match in taxonomy
-    for industry, data in INDUSTRY_TAXONOMY.items():
-        if company_lower in [c.lower() for c in data['companies']]:
-            return industry
-        for keyword in data['keywords']:
-            if keyword in company_lower:
-                return industry
+    # Direct match in taxonomy; the earliest industry matching by name or keyword wins
+    matches = [m for m in (_COMPANY_TO_INDUSTRY.get(company_lower), _keyword_industry(company_lower)) if m]
+    return min(matches, key=_INDUSTRY_ORDER.get) if matches else None
+
+
+def get_company_industry(company_name: str, github_org: str = None) -> Optional[str]:
+    """
+    Determine a company's industry based on their name, org, and repo topics.
+    Only the name lookup and successful org fetches are memoized, so a
+    transient GitHub error is retried on the next call.
+    """
+    industry = _name_industry(company_name)
+    if industry:
+        return industry
 
     # Check GitHub org topics if available
     if github_org:
         try:
-            url = f"https://api.github.com/orgs/{github_org}"
-            response = requests.get(url, headers=get_github_headers(), timeout=15)
-            if response.status_code == 200:
-                org_data = response.json()
-                description = (org_data.get('description') or '').lower()
-
-                for industry, data in INDUSTRY_TAXONOMY.items():
-                    for keyword in data['keywords']:
-                        if keyword in description:
-                            return industry
+            description = (fetch_org(github_org).get('description') or '').lower()
+            return _keyword_industry(description)
         except Exception:
             pass
 
     return None
 
 
-def get_similar_companies(company_name: str, github_org: str = None, limit: int = 10) -> List[Dict]:
+def get_similar_companies(company_name: str, github_org: str = None, limit: int = 10,
+                          industry: Optional[str] = None) -> List[Dict]:
     """
     Get similar companies based on industry taxonomy.
+    Pass `industry` when it is already known to skip the lookup.
     """
-    industry = get_company_industry(company_name, github_org)
+    if industry is None:
+        industry = get_company_industry(company_name, github_org)
 
     if not industry:
         return []
@@ -312,11 +470,20 @@ def discover_similar_companies_for_all(followed_companies: List[Dict]) -> List[D
         seen_orgs.add(company.get('github_org', '').lower())
         seen_orgs.add(company.get('name', '').lower())
 
+    # Industry lookups may hit the GitHub API, so each distinct company is
+    # looked up once and the lookups run concurrently.
+    pairs = list(dict.fromkeys(
+        (company.get('name', ''), company.get('github_org', '')) for company in followed_companies
+    ))
+    industries = dict(zip(pairs, run_parallel(
+        lambda pair: get_company_industry(*pair), pairs, config.DISCOVERY_MAX_WORKERS
+    )))
+
     for company in followed_companies:
-        similar = get_similar_companies(
-            company.get('name', ''),
-            company.get('github_org', '')
-        )
+        pair = (company.get('name', ''), company.get('github_org', ''))
+        if not industries[pair]:
+            continue
+        similar = get_similar_companies(*pair, industry=industries[pair])
 
         for suggestion in similar:
             org_lower = suggestion['github_org'].lower()
@@ -332,7 +499,7 @@ def discover_similar_companies_for_all(followed_companies: List[Dict]) -> List[D
 # 3. DEPENDENCY GRAPH DISCOVERY
 # ============================================================
 
-def search_repos_using_library(library: str, min_stars: int = 500) -> List[Dict]:
+def search_repos_using_library(library: str, min_stars: int = 500, exclude_orgs: Iterable[str] = ()) -> List[Dict]:
     """
     Find repos that use a specific i18n library.
     """
@@ -342,14 +509,13 @@ def search_repos_using_library(library: str, min_stars: int = 500) -> List[Dict]
         # Search for repos with the library in package.json or requirements
         url = "https://api.github.com/search/code"
         params = {
-            'q': f'"{library}" filename:package.json',
+            'q': exclude_orgs_from_query(f'"{library}" filename:package.json', exclude_orgs),
             'per_page': 30
         }
 
-        response = requests.get(url, headers=get_github_headers(), params=params, timeout=30)
+        status, data = github_get(url, params=params, timeout=30)
 
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
             seen_repos = set()
 
             for item in data.get('items', []):
@@ -367,15 +533,13 @@ def search_repos_using_library(library: str, min_stars: int = 500) -> List[Dict]
                         'library': library
                     })
 
-        time.sleep(2)  # Code search has stricter rate limits
-
     except Exception as e:
         log(f"Error searching for {library} users: {e}", "WARNING")
 
     return results[:20]
 
 
-def discover_by_i18n_dependencies() -> List[Dict]:
+def discover_by_i18n_dependencies(exclude_orgs: Iterable[str] = ()) -> List[Dict]:
     """
     Discover companies using popular i18n libraries.
     """
@@ -384,9 +548,15 @@ def discover_by_i18n_dependencies() -> List[Dict]:
     all_repos = []
     seen_orgs = set()
 
-    for library in I18N_LIBRARIES[:5]:  # Limit to avoid rate limits
-        repos = search_repos_using_library(library)
+    libraries = I18N_LIBRARIES[:5]  # Limit to avoid rate limits
+    # Searches run concurrently; results are merged in library order.
+    library_repos = run_parallel(
+        lambda library: search_repos_using_library(library, exclude_orgs=exclude_orgs),
+        libraries,
+        config.DISCOVERY_MAX_WORKERS
+    )
 
+    for library, repos in zip(libraries, library_repos):
         for repo in repos:
             org = repo['owner']
             if org and org not in seen_orgs:
@@ -403,8 +573,6 @@ def discover_by_i18n_dependencies() -> List[Dict]:
                     'reason': f"Uses {library} i18n library"
                 })
 
-        time.sleep(config.REQUEST_DELAY)
-
     log(f"Found {len(all_repos)} repos using i18n libraries")
     return all_repos
 
@@ -413,7 +581,29 @@ def discover_by_i18n_dependencies() -> List[Dict]:
 # 4. GLOBAL I18N PR FIREHOSE
 # ============================================================
 
-def search_recent_i18n_prs(hours: int = 24) -> List[Dict]:
+def _search_prs(query: str) -> List[Dict]:
+    """Run one issue search for the PR firehose."""
+    try:
+        url = "https://api.github.com/search/issues"
+        params = {
+            'q': query,
+            'sort': 'created',
+            'order': 'desc',
+            'per_page': 30
+        }
+
+        status, data = github_get(url, params=params, timeout=30)
+
+        if status == 200:
+            return data.get('items', [])
+
+    except Exception as e:
+        log(f"Error in PR firehose search: {e}", "WARNING")
+
+    return []
+
+
+def search_recent_i18n_prs(hours: int = 24, exclude_orgs: Iterable[str] = ()) -> List[Dict]:
     """
     Search for recent PRs with i18n-related keywords across all of GitHub.
     """
@@ -427,65 +617,53 @@ def search_recent_i18n_prs(hours: int = 24) -> List[Dict]:
         'is:pr is:open i18n in:title created:>' + date_threshold[:10],
         'is:pr is:open "add language" in:title created:>' + date_threshold[:10],
     ]
+    search_queries = [exclude_orgs_from_query(query, exclude_orgs) for query in search_queries]
 
     seen_prs = set()
 
-    for query in search_queries:
-        try:
-            url = "https://api.github.com/search/issues"
-            params = {
-                'q': query,
-                'sort': 'created',
-                'order': 'desc',
-                'per_page': 30
-            }
-
-            response = requests.get(url, headers=get_github_headers(), params=params, timeout=30)
-
-            if response.status_code == 200:
-                data = response.json()
-
-                for pr in data.get('items', []):
-                    pr_id = pr['id']
-                    if pr_id not in seen_prs:
-                        seen_prs.add(pr_id)
-
-                        # Extract repo info from URL
-                        repo_url = pr.get('repository_url', '')
-                        repo_parts = repo_url.replace('https://api.github.com/repos/', '').split('/')
-                        owner = repo_parts[0] if len(repo_parts) > 0 else ''
-                        repo = repo_parts[1] if len(repo_parts) > 1 else ''
-
-                        results.append({
-                            'title': pr['title'],
-                            'url': pr['html_url'],
-                            'owner': owner,
-                            'repo': repo,
-                            'full_name': f"{owner}/{repo}",
-                            'author': pr['user']['login'],
-                            'created_at': pr['created_at'],
-                            'state': pr['state'],
-                            'source': 'pr_firehose'
-                        })
-
-            time.sleep(config.REQUEST_DELAY)
-
-        except Exception as e:
-            log(f"Error in PR firehose search: {e}", "WARNING")
+    # One aliased GraphQL request for all queries; without a token the REST
+    # searches run concurrently. Results are merged in query order.
+    batches = search_prs_graphql([f"{query} sort:created-desc" for query in search_queries])
+    if batches is None:
+        batches = run_parallel(_search_prs, search_queries, config.DISCOVERY_MAX_WORKERS)
+
+    for items in batches:
+        for pr in items:
+            pr_id = pr['id']
+            if pr_id not in seen_prs:
+                seen_prs.add(pr_id)
+
+                # Extract repo info from URL
+                repo_url = pr.get('repository_url', '')
+                repo_parts = repo_url.replace('https://api.github.com/repos/', '').split('/')
+                owner = repo_parts[0] if len(repo_parts) > 0 else ''
+                repo = repo_parts[1] if len(repo_parts) > 1 else ''
+
+                results.append({
+                    'title': pr['title'],
+                    'url': pr['html_url'],
+                    'owner': owner,
+                    'repo': repo,
+                    'full_name': f"{owner}/{repo}",
+                    'author': pr['user']['login'],
+                    'created_at': pr['created_at'],
+                    'state': pr['state'],
+                    'source': 'pr_firehose'
+                })
 
     # Sort by creation date
     results.sort(key=lambda x: x['created_at'], reverse=True)
     return results[:50]
 
 
-def discover_from_pr_firehose() -> List[Dict]:
+def discover_from_pr_firehose(exclude_orgs: Iterable[str] = ()) -> List[Dict]:
     """
     Discover companies from the global i18n PR firehose.
     Returns unique company suggestions from recent PRs.
     """
     log("Scanning global i18n PR firehose...")
 
-    prs = search_recent_i18n_prs()
+    prs = search_recent_i18n_prs(exclude_orgs=exclude_orgs)
     suggestions = []
     seen_orgs = set()
 
@@ -531,42 +709,44 @@ def enrich_company_data(github_org: str) -> Dict:
         'total_stars': 0
     }
 
+    languages = set()
+
     try:
         # Get org info
-        url = f"https://api.github.com/orgs/{github_org}"
-        response = requests.get(url, headers=get_github_headers(), timeout=15)
+        try:
+            org_data = fetch_org(github_org)
+        except LookupError:
+            org_data = None
 
-        if response.status_code == 200:
-            org_data = response.json()
+        if org_data is not None:
             enriched['company_name'] = org_data.get('name') or github_org
 
             blog = org_data.get('blog', '')
             if blog and blog.startswith('http'):
                 enriched['doc_urls'].append(blog)
 
-        time.sleep(config.REQUEST_DELAY)
-
         # Get repos with i18n activity
         url = f"https://api.github.com/orgs/{github_org}/repos"
         params = {'sort': 'updated', 'per_page': 30}
-        response = requests.get(url, headers=get_github_headers(), params=params, timeout=15)
+        status, repos = github_get(url, params=params, timeout=15)
 
-        if response.status_code == 200:
-            repos = response.json()
+        if status == 200:
+            repos = repos[:10]
 
-            for repo in repos[:10]:
-                enriched['total_stars'] += repo.get('stargazers_count', 0)
+            # Check for i18n signals, several repos at a time
+            repo_signals = run_parallel(
+                lambda repo: get_repo_i18n_signals(github_org, repo['name']),
+                repos,
+                config.DISCOVERY_MAX_WORKERS
+            )
 
-                # Check for i18n signals
-                signals = get_repo_i18n_signals(github_org, repo['name'])
+            for repo, signals in zip(repos, repo_signals):
+                enriched['total_stars'] += repo.get('stargazers_count', 0)
                 if signals['has_locales']:
                     enriched['github_repos'].append(repo['name'])
-                    enriched['languages_detected'].extend(signals['languages'])
-
-                time.sleep(0.5)
+                    languages.update(signals['languages'])
 
-        # Deduplicate languages
-        enriched['languages_detected'] = list(set(enriched['languages_detected']))
+        enriched['languages_detected'] = sorted(languages)
 
         # Try to guess Play Store package
         common_patterns = [
@@ -586,7 +766,7 @@ def enrich_company_data(github_org: str) -> Dict:
 # 6. LANGUAGE EXPANSION ALERTS
 # ============================================================
 
-def search_new_language_additions(min_stars: int = 1000) -> List[Dict]:
+def search_new_language_additions(min_stars: int = 1000, exclude_orgs: Iterable[str] = ()) -> List[Dict]:
     """
     Search for repos that recently added new language files.
     Focus on high-star repos that are likely real companies.
@@ -600,54 +780,41 @@ def search_new_language_additions(min_stars: int = 1000) -> List[Dict]:
         f'path:translations extension:json pushed:>{date_threshold} stars:>{min_stars}',
         f'path:i18n extension:json pushed:>{date_threshold} stars:>{min_stars}',
     ]
+    search_queries = [exclude_orgs_from_query(query, exclude_orgs) for query in search_queries]
 
     seen_repos = set()
 
-    for query in search_queries:
-        try:
-            url = "https://api.github.com/search/repositories"
-            params = {
-                'q': query,
-                'sort': 'updated',
-                'order': 'desc',
-                'per_page': 20
-            }
-
-            response = requests.get(url, headers=get_github_headers(), params=params, timeout=30)
-
-            if response.status_code == 200:
-                data = response.json()
-
-                for repo in data.get('items', []):
-                    full_name = repo['full_name']
-                    if full_name not in seen_repos:
-                        seen_repos.add(full_name)
-                        results.append({
-                            'full_name': full_name,
-                            'owner': repo['owner']['login'],
-                            'name': repo['name'],
-                            'description': repo.get('description', ''),
-                            'stars': repo['stargazers_count'],
-                            'url': repo['html_url'],
-                            'updated_at': repo['updated_at'],
-                        })
-
-            time.sleep(config.REQUEST_DELAY)
-
-        except Exception as e:
-            log(f"Error in language expansion search: {e}", "WARNING")
+    # One aliased GraphQL request for all queries; REST search per query without a token.
+    batches = search_repos_graphql([f"{query} sort:updated-desc" for query in search_queries], first=20)
+    if batches is None:
+        batches = [search_repos_rest(query, per_page=20) for query in search_queries]
+
+    for items in batches:
+        for repo in items:
+            full_name = repo['full_name']
+            if full_name not in seen_repos:
+                seen_repos.add(full_name)
+                results.append({
+                    'full_name': full_name,
+                    'owner': repo['owner']['login'],
+                    'name': repo['name'],
+                    'description': repo.get('description', ''),
+                    'stars': repo['stargazers_count'],
+                    'url': repo['html_url'],
+                    'updated_at': repo['updated_at'],
+                })
 
     results.sort(key=lambda x: x['stars'], reverse=True)
     return results[:30]
 
 
-def discover_language_expansions() -> List[Dict]:
+def discover_language_expansions(exclude_orgs: Iterable[str] = ()) -> List[Dict]:
     """
     Discover repos with recent language file additions.
     """
     log("Discovering language expansion signals...")
 
-    repos = search_new_language_additions()
+    repos = search_new_language_additions(exclude_orgs=exclude_orgs)
     suggestions = []
 
     for repo in repos:
@@ -667,8 +834,6 @@ def discover_language_expansions() -> List[Dict]:
                 'reason': f"Recently expanded to {len(signals['languages'])} languages"
             })
 
-        time.sleep(0.5)
-
     log(f"Found {len(suggestions)} language expansion signals")
     return suggestions
 
@@ -685,8 +850,9 @@ def search_companies(query: str, limit: int = 20) -> List[Dict]:
     query_lower = query.lower()
 
     # Check industry keywords first
+    keyword_industries = set(_keyword_industries(query_lower))
     for industry, data in INDUSTRY_TAXONOMY.items():
-        if query_lower in industry or any(kw in query_lower for kw in data['keywords']):
+        if query_lower in industry or industry in keyword_industries:
             for company in data['companies'][:limit]:
                 results.append({
                     'company_name': company.capitalize(),
@@ -704,10 +870,9 @@ def search_companies(query: str, limit: int = 20) -> List[Dict]:
             'per_page': limit
         }
 
-        response = requests.get(url, headers=get_github_headers(), params=params, timeout=15)
+        status, data = github_get(url, params=params, timeout=15)
 
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
             for user in data.get('items', []):
                 results.append({
                     'company_name': user['login'],
@@ -739,10 +904,7 @@ def get_ai_search_suggestions(query: str) -> List[str]:
             suggestions.append(industry)
 
     # Company suggestions from taxonomy
-    for industry, data in INDUSTRY_TAXONOMY.items():
-        for company in data['companies']:
-            if query_lower in company:
-                suggestions.append(company)
+    suggestions.extend(company for company in _TAXONOMY_COMPANIES if query_lower in company)
 
     return suggestions[:10]
 
@@ -757,6 +919,8 @@ def run_full_discovery(followed_companies: List[Dict] = None) -> Dict:
     Returns dict with categorized suggestions.
     """
     log("Running full discovery scan...")
+    fetch_org.cache_clear()
+    prune_github_cache()
 
     followed = followed_companies or []
     followed_orgs = set(c.get('github_org', '').lower() for c in followed)
@@ -770,13 +934,21 @@ def run_full_discovery(followed_companies: List[Dict] = None) -> Dict:
         'last_updated': datetime.now().isoformat()
     }
 
-    # Run discovery methods in parallel where possible
-    with ThreadPoolExecutor(max_workers=3) as executor:
+    # Followed orgs are excluded in the search queries too, so they don't
+    # take up result slots; the filter below still applies.
+    exclude_orgs = sorted(org for org in followed_orgs if org)
+
+    # Run discovery methods in parallel
+    with ThreadPoolExecutor(max_workers=5) as executor:
         futures = {
-            executor.submit(discover_trending_i18n_companies): 'trending',
-            executor.submit(discover_from_pr_firehose): 'pr_firehose',
-            executor.submit(discover_language_expansions): 'expansions',
+            executor.submit(discover_trending_i18n_companies, exclude_orgs): 'trending',
+            executor.submit(discover_from_pr_firehose, exclude_orgs): 'pr_firehose',
+            executor.submit(discover_language_expansions, exclude_orgs): 'expansions',
+            executor.submit(discover_by_i18n_dependencies, exclude_orgs): 'dependencies',
         }
+        # Similar companies (needs followed list)
+        if followed:
+            futures[executor.submit(discover_similar_companies_for_all, followed)] = 'similar'
 
         for future in as_completed(futures):
             category = futures[future]
@@ -787,31 +959,17 @@ def run_full_discovery(followed_companies: List[Dict] = None) -> Dict:
                     r for r in results
                     if r.get('github_org', '').lower() not in followed_orgs
                 ]
+                if category == 'dependencies':
+                    filtered = filtered[:20]
                 all_suggestions[category] = filtered
             except Exception as e:
                 log(f"Error in {category} discovery: {e}", "ERROR")
 
-    # Similar companies (needs followed list)
-    if followed:
-        similar = discover_similar_companies_for_all(followed)
-        all_suggestions['similar'] = [
-            s for s in similar
-            if s.get('github_org', '').lower() not in followed_orgs
-        ]
-
-    # Dependencies discovery (slower, run separately)
-    try:
-        deps = discover_by_i18n_dependencies()
-        all_suggestions['dependencies'] = [
-            d for d in deps
-            if d.get('github_org', '').lower() not in followed_orgs
-        ][:20]
-    except Exception as e:
-        log(f"Error in dependency discovery: {e}", "ERROR")
-
-    # Save to cache
+    # Save to cache; only categories whose results changed are rewritten
     try:
-        save_json(SUGGESTIONS_FILE, all_suggestions)
+        cached = load_state("discovery_suggestions", SUGGESTIONS_FILE)
+        cached.update(all_suggestions)
+        save_state(cached)
     except Exception as e:
         log(f"Error saving suggestions cache: {e}", "WARNING")
 
@@ -826,11 +984,9 @@ def get_cached_suggestions() -> Dict:
     Get cached suggestions if available.
     """
     try:
-        if os.path.exists(SUGGESTIONS_FILE):
-            return load_json(SUGGESTIONS_FILE)
+        return dict(load_state("discovery_suggestions", SUGGESTIONS_FILE))
     except Exception:
-        pass
-    return {}
+        return {}
 
 
 def get_quick_suggestions(followed_companies: List[Dict] = None, limit: int = 20) -> List[Dict]:
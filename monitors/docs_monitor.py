@@ -4,74 +4,286 @@ Detects hreflang changes and keyword additions in developer docs.
 """
 
 import hashlib
+import json
+import multiprocessing
 import os
-import re
-import requests
-from bs4 import BeautifulSoup
+import threading
+import zlib
+from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, List, Optional, Set, Tuple
 
 import config
 from .common import (
-    log, alert, load_json, save_json, sanitize_filename,
-    contains_keywords
+    log, http_session, alert, alert_buffer, sanitize_filename,
+    contains_keywords, run_parallel
 )
+from .state import load_state, save_state, state_get, state_get_raw, state_set_many
 
-try:
-    import storage
-    DB_AVAILABLE = True
-except:
-    DB_AVAILABLE = False
 
+# HTML parsing is CPU-bound pure Python, so pages are parsed in worker
+# processes to sidestep the GIL. Created lazily on first use.
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
 
-def fetch_doc_page(url: str) -> Tuple[Optional[str], Optional[str], Set[str]]:
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            # forkserver: forking this multithreaded process could copy a
+            # lock (e.g. logging's) held by another thread into the child.
+            _PARSE_POOL = ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, config.DOCS_PARSE_MAX_WORKERS),
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+        return _PARSE_POOL
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken parse pool so the next call starts a fresh one."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def get_url_key(url: str) -> str:
+    """Stable short key for a doc URL in the state files."""
+    return hashlib.md5(url.encode()).hexdigest()[:16]
+
+
+def _read_capped(response, url: str) -> bytes:
+    """Read a streamed body, stopping at config.DOC_MAX_BYTES."""
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= config.DOC_MAX_BYTES:
+            log(f"{url} is larger than {config.DOC_MAX_BYTES} bytes, truncating", "WARNING")
+            break
+    return b"".join(chunks)[:config.DOC_MAX_BYTES]
+
+
+def fetch_doc_html(url: str, validators: Optional[Dict] = None) -> Optional[str]:
     """
-    Fetch a documentation page and extract text content, hash, and hreflang values.
-    Returns (text_content, content_hash, hreflang_set)
+    Download the raw HTML of a documentation page.
+    If `validators` holds a stored etag/last_modified the request is conditional:
+    returns None on 304, otherwise refreshes `validators` from the response.
     """
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (compatible; LocalizationMonitor/1.0)"
         }
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        hreflang_tags = soup.find_all('link', rel='alternate', hreflang=True)
-        hreflangs = set()
-        for tag in hreflang_tags:
-            lang = tag.get('hreflang', '').lower()
-            if lang and lang != 'x-default':
-                hreflangs.add(lang)
-        
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
         
-        content_hash = hashlib.md5(text.encode()).hexdigest()
-        
-        return text, content_hash, hreflangs
+        response = http_session.get(url, headers=headers, timeout=30, stream=True)
+        try:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            body = _read_capped(response, url)
+        finally:
+            response.close()
         
+        if validators is not None:
+            validators.clear()
+            if response.headers.get("ETag"):
+                validators["etag"] = response.headers["ETag"]
+            if response.headers.get("Last-Modified"):
+                validators["last_modified"] = response.headers["Last-Modified"]
+        return body.decode(response.encoding or 'utf-8', errors='replace')
     except Exception as e:
         log(f"Error fetching {url}: {e}", "WARNING")
+        return None
+
+
+class _DocTextParser(HTMLParser):
+    """
+    Streaming extractor: collects text outside <script>/<style> and the
+    hreflang of <link rel="alternate"> tags without building a DOM.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.hreflangs: Set[str] = set()
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip_depth += 1
+        elif tag == 'link':
+            attrs = dict(attrs)
+            if 'hreflang' in attrs and 'alternate' in (attrs.get('rel') or '').split():
+                self.hreflangs.add((attrs['hreflang'] or '').lower())
+    
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self._skip_depth:
+            self._skip_depth -= 1
+    
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+    
+    def unknown_decl(self, data):
+        if data.upper().startswith('CDATA[') and not self._skip_depth:
+            self.parts.append(data[len('CDATA['):])
+
+
+def _parse_with_html_parser(html: str) -> Tuple[str, Set[str]]:
+    """Raw text and hreflangs via the stdlib streaming parser."""
+    parser = _DocTextParser()
+    parser.feed(html)
+    parser.close()
+    return ''.join(parser.parts), parser.hreflangs
+
+
+def extract_doc_content(html: str) -> Tuple[str, Set[str]]:
+    """
+    Extract stripped text content and hreflang values from page HTML.
+    Top-level so it can be shipped to the parse pool.
+    """
+    text, hreflangs = _parse_with_html_parser(html)
+    hreflangs.discard('')
+    hreflangs.discard('x-default')
+    
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    text = '\n'.join(chunk for chunk in chunks if chunk)
+    
+    return text, hreflangs
+
+
+CONTENT_HASH_PREFIX = "b2:"
+
+
+def hash_text(text: str) -> str:
+    """Change-detection hash of extracted page text (BLAKE2b, prefixed to tell it from legacy MD5)."""
+    return CONTENT_HASH_PREFIX + hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _to_page(text: str, hreflangs: Set[str]) -> Tuple[str, str, Set[str]]:
+    return text, hash_text(text), hreflangs
+
+
+def fetch_doc_page(url: str) -> Tuple[Optional[str], Optional[str], Set[str]]:
+    """
+    Fetch a documentation page and extract text content, hash, and hreflang values.
+    Returns (text_content, content_hash, hreflang_set)
+    """
+    html = fetch_doc_html(url)
+    if html is None:
         return None, None, set()
+    
+    try:
+        return _to_page(*extract_doc_content(html))
+    except Exception as e:
+        log(f"Error parsing {url}: {e}", "WARNING")
+        return None, None, set()
+
+
+def fetch_doc_pages(urls: List[str],
+                    validators: Optional[List[Dict]] = None) -> List[Tuple[Optional[str], Optional[str], Set[str]]]:
+    """
+    Fetch several documentation pages concurrently, parsing them in the parse pool.
+    `validators` is an optional per-URL list of conditional-request dicts (see fetch_doc_html).
+    Returns one (text_content, content_hash, hreflang_set) tuple per URL;
+    unchanged (304) pages come back empty like failed fetches.
+    """
+    if validators is None:
+        validators = [None] * len(urls)
+    htmls = run_parallel(lambda job: fetch_doc_html(*job), list(zip(urls, validators)), config.DOCS_MAX_WORKERS, pool="docs")
+    pending = [i for i, html in enumerate(htmls) if html is not None]
+    pages = [(None, None, set()) for _ in urls]
+    
+    if not pending:
+        return pages
+    
+    pool = None
+    try:
+        pool = _get_parse_pool()
+        parsed = list(pool.map(extract_doc_content, [htmls[i] for i in pending]))
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool) and pool is not None:
+            # A crashed worker breaks the pool for good; replace it next time.
+            _discard_parse_pool(pool)
+        log(f"Parse pool unavailable, parsing in-process: {e}", "WARNING")
+        parsed = []
+        for i in pending:
+            try:
+                parsed.append(extract_doc_content(htmls[i]))
+            except Exception as parse_error:
+                log(f"Error parsing {urls[i]}: {parse_error}", "WARNING")
+                parsed.append(None)
+    
+    for i, result in zip(pending, parsed):
+        if result is not None:
+            pages[i] = _to_page(*result)
+    
+    return pages
+
+
+def load_previous_text(url_key: str) -> str:
+    """Last stored text of a doc page, falling back to the legacy per-URL text file."""
+    stored = state_get_raw("previous_texts", url_key)
+    if isinstance(stored, bytes):
+        return zlib.decompress(stored).decode('utf-8')
+    if stored is not None:
+        return json.loads(stored)
+    
+    prev_text_file = os.path.join(config.PREVIOUS_TEXTS_DIR, f"{url_key}.txt")
+    if os.path.exists(prev_text_file):
+        try:
+            with open(prev_text_file, 'r') as f:
+                return f.read()
+        except:
+            pass
+    return ""
+
+
+def keyword_signature() -> str:
+    """Fingerprint of the configured keyword list, to tell when stored keyword sets are stale."""
+    return hashlib.blake2b("\n".join(config.KEYWORDS).encode(), digest_size=8).hexdigest()
+
+
+def load_previous_keywords(url_key: str) -> Set[str]:
+    """
+    Keywords found in the last stored text of a doc page.
+    Uses the keyword set saved with the text; rescans the text only when none
+    was saved or the keyword list has changed since.
+    """
+    stored = state_get("doc_keywords", url_key)
+    if stored and stored.get("signature") == keyword_signature():
+        return set(stored["keywords"])
+    
+    previous_text = load_previous_text(url_key)
+    return set(contains_keywords(previous_text)) if previous_text else set()
 
 
-def check_doc_url(company: str, url: str, doc_hashes: Dict, prev_hreflangs: Dict) -> int:
+def check_doc_url(company: str, url: str, doc_hashes: Dict, prev_hreflangs: Dict,
+                  page: Optional[Tuple[Optional[str], Optional[str], Set[str]]] = None,
+                  pending_writes: Optional[List[Tuple[str, str, object]]] = None) -> int:
     """
     Check a documentation URL for changes.
     Primary: New hreflang tags (indicating new regional versions)
     Secondary: Keyword changes in text content
+    Pass an already fetched `page` (as returned by fetch_doc_page) to skip the fetch.
+    Pass `pending_writes` to collect the changed page's stored text and keywords
+    as state rows for the caller to write in one batch, instead of writing now.
     Returns the number of alerts generated.
     """
     alert_count = 0
-    url_key = hashlib.md5(url.encode()).hexdigest()[:16]
+    url_key = get_url_key(url)
     
-    text, content_hash, current_hreflangs = fetch_doc_page(url)
+    text, content_hash, current_hreflangs = page if page is not None else fetch_doc_page(url)
     
     if text is None:
         return 0
@@ -91,30 +303,30 @@ def check_doc_url(company: str, url: str, doc_hashes: Dict, prev_hreflangs: Dict
         )
         alert(alert_msg)
         
-        if DB_AVAILABLE:
-            try:
-                storage.save_alert(
-                    source="docs",
-                    company=company,
-                    title=f"[{signal_type}] New regional docs: {', '.join(new_langs[:3])}",
-                    message=f"Doc change detected: {url}",
-                    keywords=new_langs,
-                    url=url,
-                    metadata={
-                        "signal_type": signal_type,
-                        "new_hreflangs": new_langs,
-                        "total_hreflangs": len(current_hreflangs),
-                        "previous_hreflang_count": len(previous_hreflangs)
-                    }
-                )
-            except Exception as e:
-                log(f"Failed to save docs alert: {e}", "WARNING")
+        alert_buffer.add(
+            source="docs",
+            company=company,
+            title=f"[{signal_type}] New regional docs: {', '.join(new_langs[:3])}",
+            message=f"Doc change detected: {url}",
+            keywords=new_langs,
+            url=url,
+            metadata={
+                "signal_type": signal_type,
+                "new_hreflangs": new_langs,
+                "total_hreflangs": len(current_hreflangs),
+                "previous_hreflang_count": len(previous_hreflangs)
+            }
+        )
         
         alert_count += 1
     
     prev_hreflangs[url_key] = list(current_hreflangs)
     
     previous_hash = doc_hashes.get(url_key)
+    if (previous_hash and not previous_hash.startswith(CONTENT_HASH_PREFIX)
+            and previous_hash == hashlib.md5(text.encode()).hexdigest()):
+        # Stored by an older version as MD5; unchanged text is not a change.
+        previous_hash = content_hash
     
     if previous_hash is None:
         keywords_found = contains_keywords(text)
@@ -127,32 +339,19 @@ def check_doc_url(company: str, url: str, doc_hashes: Dict, prev_hreflangs: Dict
             )
             alert(alert_msg)
             
-            if DB_AVAILABLE:
-                try:
-                    storage.save_alert(
-                        source="docs",
-                        company=company,
-                        title=f"Doc change detected: {url}",
-                        message=f"New keywords: First scan",
-                        keywords=keywords_found[:10],
-                        url=url,
-                        metadata={"signal_type": signal_type}
-                    )
-                except Exception as e:
-                    log(f"Failed to save docs alert: {e}", "WARNING")
+            alert_buffer.add(
+                source="docs",
+                company=company,
+                title=f"Doc change detected: {url}",
+                message=f"New keywords: First scan",
+                keywords=keywords_found[:10],
+                url=url,
+                metadata={"signal_type": signal_type}
+            )
             
             alert_count += 1
     elif content_hash != previous_hash:
-        prev_text_file = os.path.join(config.PREVIOUS_TEXTS_DIR, f"{url_key}.txt")
-        previous_text = ""
-        if os.path.exists(prev_text_file):
-            try:
-                with open(prev_text_file, 'r') as f:
-                    previous_text = f.read()
-            except:
-                pass
-        
-        prev_keywords = set(contains_keywords(previous_text)) if previous_text else set()
+        prev_keywords = load_previous_keywords(url_key)
         curr_keywords = set(contains_keywords(text))
         new_keywords = curr_keywords - prev_keywords
         
@@ -167,27 +366,26 @@ def check_doc_url(company: str, url: str, doc_hashes: Dict, prev_hreflangs: Dict
             )
             alert(alert_msg)
             
-            if DB_AVAILABLE:
-                try:
-                    storage.save_alert(
-                        source="docs",
-                        company=company,
-                        title=f"Doc change detected: {url}",
-                        message=f"New keywords: {', '.join(new_kw_list)}",
-                        keywords=new_kw_list,
-                        url=url,
-                        metadata={"signal_type": signal_type}
-                    )
-                except Exception as e:
-                    log(f"Failed to save docs alert: {e}", "WARNING")
+            alert_buffer.add(
+                source="docs",
+                company=company,
+                title=f"Doc change detected: {url}",
+                message=f"New keywords: {', '.join(new_kw_list)}",
+                keywords=new_kw_list,
+                url=url,
+                metadata={"signal_type": signal_type}
+            )
             
             alert_count += 1
         
-        try:
-            with open(prev_text_file, 'w') as f:
-                f.write(text)
-        except:
-            pass
+        rows = [
+            ("previous_texts", url_key, zlib.compress(text.encode('utf-8'))),
+            ("doc_keywords", url_key, {"keywords": sorted(curr_keywords), "signature": keyword_signature()}),
+        ]
+        if pending_writes is None:
+            state_set_many(rows)
+        else:
+            pending_writes.extend(rows)
     
     doc_hashes[url_key] = content_hash
     
@@ -197,21 +395,41 @@ def check_doc_url(company: str, url: str, doc_hashes: Dict, prev_hreflangs: Dict
 def check_all_docs(targets: List[Dict]) -> int:
     """Check all configured documentation URLs."""
     log("Starting documentation checks...")
-    doc_hashes = load_json(config.DOC_HASHES_FILE)
-    prev_hreflangs = load_json(config.DOC_HASHES_FILE.replace('.json', '_hreflangs.json'))
+    doc_hashes = load_state("doc_hashes", config.DOC_HASHES_FILE)
+    prev_hreflangs = load_state("doc_hreflangs", config.DOC_HASHES_FILE.replace('.json', '_hreflangs.json'))
+    doc_validators = load_state("doc_validators", config.DOC_HASHES_FILE.replace('.json', '_validators.json'))
     total_alerts = 0
     urls_checked = 0
     
-    for target in targets:
-        company = target.get("company", "Unknown")
-        doc_urls = target.get("doc_urls", [])
-        
-        for url in doc_urls:
-            alerts = check_doc_url(company, url, doc_hashes, prev_hreflangs)
-            total_alerts += alerts
-            urls_checked += 1
+    jobs = [
+        (target.get("company", "Unknown"), url)
+        for target in targets
+        for url in target.get("doc_urls", [])
+    ]
+    # Companies can share doc URLs; fetch each distinct URL once per cycle.
+    urls = list(dict.fromkeys(url for _, url in jobs))
+    # Only send validators for pages we have a stored hash for, so a
+    # missing hash always triggers a full fetch.
+    url_validators = {
+        url: dict(doc_validators.get(get_url_key(url), {})) if get_url_key(url) in doc_hashes else {}
+        for url in urls
+    }
+    pages = dict(zip(urls, fetch_doc_pages(urls, [url_validators[url] for url in urls])))
+    pending_writes = []
+    
+    for company, url in jobs:
+        page = pages[url]
+        alerts = check_doc_url(company, url, doc_hashes, prev_hreflangs, page=page, pending_writes=pending_writes)
+        total_alerts += alerts
+        urls_checked += 1
+        if page[0] is not None:
+            doc_validators[get_url_key(url)] = url_validators[url]
     
-    save_json(config.DOC_HASHES_FILE, doc_hashes)
-    save_json(config.DOC_HASHES_FILE.replace('.json', '_hreflangs.json'), prev_hreflangs)
+    # Stored texts go in before the hashes that mark them as seen.
+    state_set_many(pending_writes)
+    save_state(doc_hashes)
+    save_state(prev_hreflangs)
+    save_state(doc_validators)
+    alert_buffer.flush()
     log(f"Documentation checks complete. Checked {urls_checked} URLs, found {total_alerts} alerts.")
     return total_alerts
@@ -4,55 +4,102 @@ Detects localization file additions and PR activity.
 """
 
 import os
-import time
+import threading
 import requests
 from typing import Dict, List, Optional
 
 import config
 from .common import (
-    log, alert, load_json, save_json, get_headers,
+    log, alert, alert_buffer, get_headers, github_graphql, github_fetch,
+    run_parallel, parse_json,
     is_bot_author, is_localization_file, extract_language_from_file,
     contains_keywords
 )
+from .state import load_state, save_state, state_set_many
 
-try:
-    import storage
-    DB_AVAILABLE = True
-except:
-    DB_AVAILABLE = False
+
+PR_TITLE_KEYWORDS = [
+    "translation", "translate", "localization", "localisation",
+    "i18n", "l10n", "language", "arabic", "french", "spanish",
+    "german", "chinese", "japanese", "korean", "portuguese"
+]
+
+# The compare API lists at most this many files for a range.
+COMPARE_MAX_FILES = 300
 
 
 def get_commit_files(org: str, repo: str, sha: str) -> List[Dict]:
     """Fetch the files changed in a specific commit."""
     try:
         url = f"https://api.github.com/repos/{org}/{repo}/commits/{sha}"
-        response = requests.get(url, headers=get_headers(), timeout=30)
+        response = github_fetch(url, headers=get_headers(), timeout=30)
         if response.status_code == 200:
-            commit_data = response.json()
+            commit_data = parse_json(response)
             return commit_data.get("files", [])
     except Exception as e:
         log(f"Error fetching commit files for {sha}: {e}", "WARNING")
     return []
 
 
+def get_compare_files(org: str, repo: str, base: str, head: str) -> Optional[List[Dict]]:
+    """
+    Fetch the files changed across base...head in one request.
+    Returns None when the comparison fails or the file list is truncated.
+    """
+    try:
+        url = f"https://api.github.com/repos/{org}/{repo}/compare/{base}...{head}"
+        response = github_fetch(url, headers=get_headers(), params={"per_page": 1}, timeout=30)
+        if response.status_code == 200:
+            files = parse_json(response).get("files", [])
+            if len(files) < COMPARE_MAX_FILES:
+                return files
+    except Exception as e:
+        log(f"Error comparing {org}/{repo} {base[:7]}...{head[:7]}: {e}", "WARNING")
+    return None
+
+
+def get_repo_state(last_commits: Dict, repo_key: str) -> Dict:
+    """
+    Get the stored state for a repo as a dict ({"sha": ..., "etag": ...}).
+    Older state files stored just the last seen SHA as a string.
+    """
+    state = last_commits.get(repo_key)
+    if isinstance(state, str):
+        return {"sha": state}
+    return state or {}
+
+
 def check_github_repo(company: str, org: str, repo: str, last_commits: Dict) -> int:
     """
     Check a GitHub repository for new localization file additions.
+    Uses a conditional request so unchanged repos cost a single 304, and
+    once a commit date is known only fetches commits since then.
     Returns the number of alerts generated.
     """
     alert_count = 0
     repo_key = f"{company}/{org}/{repo}"
+    repo_state = get_repo_state(last_commits, repo_key)
     
     try:
         url = f"https://api.github.com/repos/{org}/{repo}/commits"
+        # A repo seen for the first time gets just the newest 20 commits.
         params = {"per_page": 20}
+        if repo_state.get("date"):
+            # Only commits since the last one seen, paginated below.
+            params = {"per_page": 100, "since": repo_state["date"]}
         
-        response = requests.get(url, headers=get_headers(), params=params, timeout=30)
+        headers = get_headers()
+        if repo_state.get("etag"):
+            headers["If-None-Match"] = repo_state["etag"]
+        
+        response = github_fetch(url, headers=headers, params=params, timeout=30)
+        
+        if response.status_code == 304:
+            return 0
         
         if response.status_code == 403:
             remaining = response.headers.get("X-RateLimit-Remaining", "unknown")
-            log(f"GitHub rate limit hit (remaining: {remaining}). Sleeping...", "WARNING")
-            time.sleep(config.GITHUB_RATE_LIMIT_SLEEP)
+            log(f"GitHub rate limit hit (remaining: {remaining}), skipping {org}/{repo}", "WARNING")
             return 0
         
         if response.status_code == 404:
@@ -60,20 +107,65 @@ def check_github_repo(company: str, org: str, repo: str, last_commits: Dict) ->
             return 0
         
         response.raise_for_status()
-        commits = response.json()
+        commits = parse_json(response)
+        
+        next_url = response.links.get("next", {}).get("url")
+        pages = 1
+        while next_url and "since" in params and pages < config.GITHUB_MAX_COMMIT_PAGES:
+            page = github_fetch(next_url, headers=get_headers(), timeout=30)
+            page.raise_for_status()
+            commits.extend(parse_json(page))
+            next_url = page.links.get("next", {}).get("url")
+            pages += 1
         
         if not commits:
             return 0
         
-        last_sha = last_commits.get(repo_key)
+        last_sha = repo_state.get("sha")
         new_last_sha = commits[0]["sha"]
+        new_last_date = commits[0].get("commit", {}).get("committer", {}).get("date")
         
+        new_commits = []
         for commit in commits:
-            sha = commit["sha"]
-            
-            if sha == last_sha:
+            if commit["sha"] == last_sha:
                 break
-            
+            new_commits.append(commit)
+        new_shas = {commit["sha"] for commit in new_commits}
+        
+        # A merge's diff repeats its merged-in commits; when those are
+        # part of this batch they are scanned individually.
+        to_fetch = []
+        for commit in new_commits:
+            if is_bot_author(commit.get("commit", {}).get("author", {}).get("name", "Unknown")):
+                continue
+            merged_parents = [p.get("sha") for p in commit.get("parents", [])[1:]]
+            if not (merged_parents and all(p in new_shas for p in merged_parents)):
+                to_fetch.append(commit["sha"])
+        
+        # One compare call covers the whole range; per-commit details are
+        # only needed when it shows a localization file being added.
+        if last_sha and len(to_fetch) > 1:
+            range_files = get_compare_files(org, repo, last_sha, new_last_sha)
+            if range_files is not None and not any(
+                f.get("status") == "added" and is_localization_file(f.get("filename", ""))
+                for f in range_files
+            ):
+                to_fetch = []
+        
+        # Bound the burst of detail requests; older commits past the cap
+        # still get the keyword check below.
+        if len(to_fetch) > config.GITHUB_MAX_COMMIT_DETAILS:
+            log(f"{org}/{repo}: fetching files for the newest {config.GITHUB_MAX_COMMIT_DETAILS} "
+                f"of {len(to_fetch)} new commits")
+            to_fetch = to_fetch[:config.GITHUB_MAX_COMMIT_DETAILS]
+        
+        # Commit details are independent requests, so fetch them concurrently.
+        commit_files = dict(zip(to_fetch, run_parallel(
+            lambda sha: get_commit_files(org, repo, sha), to_fetch, config.GITHUB_COMMIT_FILE_WORKERS
+        )))
+        
+        for commit in new_commits:
+            sha = commit["sha"]
             author = commit.get("commit", {}).get("author", {}).get("name", "Unknown")
             
             if is_bot_author(author):
@@ -83,9 +175,9 @@ def check_github_repo(company: str, org: str, repo: str, last_commits: Dict) ->
             message = commit.get("commit", {}).get("message", "")
             short_message = message.split('\n')[0][:100]
             
-            files = get_commit_files(org, repo, sha)
+            files = commit_files.get(sha, [])
             new_l10n_files = []
-            detected_languages = []
+            languages = set()
             
             for file_info in files:
                 filepath = file_info.get("filename", "")
@@ -94,8 +186,10 @@ def check_github_repo(company: str, org: str, repo: str, last_commits: Dict) ->
                 if status == "added" and is_localization_file(filepath):
                     new_l10n_files.append(filepath)
                     lang = extract_language_from_file(filepath)
-                    if lang and lang not in detected_languages:
-                        detected_languages.append(lang)
+                    if lang:
+                        languages.add(lang)
+            
+            detected_languages = sorted(languages)
             
             if new_l10n_files:
                 signal_type = "NEW_LANG_FILE"
@@ -113,19 +207,15 @@ def check_github_repo(company: str, org: str, repo: str, last_commits: Dict) ->
                 )
                 alert(alert_msg)
                 
-                if DB_AVAILABLE:
-                    try:
-                        storage.save_alert(
-                            source="github",
-                            company=company,
-                            title=f"[{signal_type}] {org}/{repo}: {files_display}",
-                            message=f"New localization files by {author}. {short_message}",
-                            keywords=keywords,
-                            url=commit_url,
-                            metadata={"sha": sha, "author": author, "signal_type": signal_type, "files": new_l10n_files[:5]}
-                        )
-                    except Exception as e:
-                        log(f"Failed to save alert to database: {e}", "WARNING")
+                alert_buffer.add(
+                    source="github",
+                    company=company,
+                    title=f"[{signal_type}] {org}/{repo}: {files_display}",
+                    message=f"New localization files by {author}. {short_message}",
+                    keywords=keywords,
+                    url=commit_url,
+                    metadata={"sha": sha, "author": author, "signal_type": signal_type, "files": new_l10n_files[:5]}
+                )
                 
                 alert_count += 1
             else:
@@ -142,23 +232,23 @@ def check_github_repo(company: str, org: str, repo: str, last_commits: Dict) ->
                     )
                     alert(alert_msg)
                     
-                    if DB_AVAILABLE:
-                        try:
-                            storage.save_alert(
-                                source="github",
-                                company=company,
-                                title=f"[{signal_type}] {org}/{repo}: {short_message}",
-                                message=f"By {author}",
-                                keywords=matched_keywords,
-                                url=commit_url,
-                                metadata={"sha": sha, "author": author, "signal_type": signal_type}
-                            )
-                        except Exception as e:
-                            log(f"Failed to save alert to database: {e}", "WARNING")
+                    alert_buffer.add(
+                        source="github",
+                        company=company,
+                        title=f"[{signal_type}] {org}/{repo}: {short_message}",
+                        message=f"By {author}",
+                        keywords=matched_keywords,
+                        url=commit_url,
+                        metadata={"sha": sha, "author": author, "signal_type": signal_type}
+                    )
                     
                     alert_count += 1
         
-        last_commits[repo_key] = new_last_sha
+        last_commits[repo_key] = {
+            "sha": new_last_sha,
+            "date": new_last_date,
+            "etag": response.headers.get("ETag")
+        }
         
     except requests.RequestException as e:
         log(f"Error checking GitHub repo {org}/{repo}: {e}", "ERROR")
@@ -172,9 +262,9 @@ def get_pr_reviewers(org: str, repo: str, pr_number: int) -> List[str]:
     """Fetch reviewers assigned to a PR."""
     try:
         url = f"https://api.github.com/repos/{org}/{repo}/pulls/{pr_number}/requested_reviewers"
-        response = requests.get(url, headers=get_headers(), timeout=15)
+        response = github_fetch(url, headers=get_headers(), timeout=15)
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             reviewers = [u.get("login") for u in data.get("users", []) if u.get("login")]
             return reviewers
     except Exception as e:
@@ -182,20 +272,64 @@ def get_pr_reviewers(org: str, repo: str, pr_number: int) -> List[str]:
     return []
 
 
-def check_github_prs(company: str, org: str, repo: str) -> int:
+def get_prs_reviewers(org: str, repo: str, pr_numbers: List[int]) -> Dict[int, List[str]]:
+    """
+    Fetch reviewers for several PRs at once.
+    Uses a single aliased GraphQL query instead of one REST call per PR,
+    falling back to REST when GraphQL is unavailable.
+    """
+    if not pr_numbers:
+        return {}
+    
+    fields = " ".join(
+        f"pr{number}: pullRequest(number: {int(number)}) {{"
+        f" reviewRequests(first: 20) {{ nodes {{ requestedReviewer {{ ... on User {{ login }} }} }} }} }}"
+        for number in pr_numbers
+    )
+    query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+    data = github_graphql(query, {"owner": org, "name": repo})
+    repository = (data or {}).get("repository")
+    
+    if not repository:
+        return {number: get_pr_reviewers(org, repo, number) for number in pr_numbers}
+    
+    reviewers = {}
+    for number in pr_numbers:
+        review_requests = ((repository.get(f"pr{number}") or {}).get("reviewRequests") or {}).get("nodes", [])
+        reviewers[number] = [
+            (r.get("requestedReviewer") or {}).get("login")
+            for r in review_requests
+            if (r.get("requestedReviewer") or {}).get("login")
+        ]
+    return reviewers
+
+
+def check_github_prs(company: str, org: str, repo: str, pr_states: Optional[Dict] = None) -> int:
     """
     Check open Pull Requests for localization signals.
     PRs titled with translation/localization keywords indicate intent before merge.
     Also fetches PR reviewers as potential sales contacts.
+    When pr_states is given, the PR list is requested conditionally (an
+    unchanged list costs a 304), and only PRs that are new or updated since
+    the last check are considered.
     Returns the number of alerts generated.
     """
     alert_count = 0
+    repo_key = f"{company}/{org}/{repo}"
     
     try:
         url = f"https://api.github.com/repos/{org}/{repo}/pulls"
         params = {"state": "open", "per_page": 30}
         
-        response = requests.get(url, headers=get_headers(), params=params, timeout=30)
+        headers = get_headers()
+        pr_state = (pr_states or {}).get(repo_key) or {}
+        if pr_state.get("etag"):
+            headers["If-None-Match"] = pr_state["etag"]
+        
+        response = github_fetch(url, headers=headers, params=params, timeout=30)
+        
+        if response.status_code == 304:
+            return 0
         
         if response.status_code == 403:
             log(f"GitHub rate limit hit for PR check", "WARNING")
@@ -205,62 +339,73 @@ def check_github_prs(company: str, org: str, repo: str) -> int:
             return 0
         
         response.raise_for_status()
-        prs = response.json()
+        prs = parse_json(response)
         
-        l10n_keywords = [
-            "translation", "translate", "localization", "localisation",
-            "i18n", "l10n", "language", "arabic", "french", "spanish",
-            "german", "chinese", "japanese", "korean", "portuguese"
-        ]
+        seen = set(pr_state.get("seen", []))
+        latest_updated = pr_state.get("latest_updated", "")
+        if pr_states is not None:
+            pr_states[repo_key] = {
+                "etag": response.headers.get("ETag"),
+                "seen": [pr.get("number") for pr in prs],
+                "latest_updated": max([latest_updated] + [pr.get("updated_at") or "" for pr in prs])
+            }
+        if pr_state:
+            # ISO 8601 timestamps compare correctly as strings.
+            prs = [
+                pr for pr in prs
+                if pr.get("number") not in seen or (pr.get("updated_at") or "") > latest_updated
+            ]
         
+        matching_prs = []
         for pr in prs:
-            title = pr.get("title", "").lower()
-            body = (pr.get("body") or "").lower()
-            pr_url = pr.get("html_url", "")
-            pr_number = pr.get("number", 0)
+            title = pr.get("title", "")
             author = pr.get("user", {}).get("login", "Unknown")
             
             if is_bot_author(author):
                 continue
             
-            title_matches = [kw for kw in l10n_keywords if kw in title]
+            title_matches = contains_keywords(title, PR_TITLE_KEYWORDS)
             
             if title_matches:
-                signal_type = "OPEN_PR"
-                
-                reviewers = get_pr_reviewers(org, repo, pr_number)
-                
-                alert_msg = (
-                    f"GITHUB [{signal_type}] [{company}] {org}/{repo}:\n"
-                    f"  PR #{pr_number}: {pr.get('title', 'No title')}\n"
-                    f"  Author: {author}\n"
-                    f"  Reviewers: {', '.join(reviewers) if reviewers else 'None assigned'}\n"
-                    f"  Keywords: {', '.join(title_matches)}\n"
-                    f"  URL: {pr_url}"
-                )
-                alert(alert_msg)
-                
-                if DB_AVAILABLE:
-                    try:
-                        storage.save_alert(
-                            source="github",
-                            company=company,
-                            title=f"[{signal_type}] PR #{pr_number}: {pr.get('title', '')[:80]}",
-                            message=f"Open pull request by {author} - early localization signal",
-                            keywords=title_matches,
-                            url=pr_url,
-                            metadata={
-                                "pr_number": pr_number, 
-                                "author": author, 
-                                "signal_type": signal_type,
-                                "reviewers": reviewers,
-                                "detected_languages": title_matches
-                            }
-                        )
-                    except Exception as e:
-                        log(f"Failed to save PR alert: {e}", "WARNING")
-                
-                alert_count += 1
+                matching_prs.append((pr, author, title_matches))
+        
+        reviewers_by_pr = get_prs_reviewers(org, repo, [pr.get("number", 0) for pr, _, _ in matching_prs])
+        
+        for pr, author, title_matches in matching_prs:
+            pr_url = pr.get("html_url", "")
+            pr_number = pr.get("number", 0)
+            
+            signal_type = "OPEN_PR"
+            
+            reviewers = reviewers_by_pr.get(pr_number, [])
+            
+            alert_msg = (
+                f"GITHUB [{signal_type}] [{company}] {org}/{repo}:\n"
+                f"  PR #{pr_number}: {pr.get('title', 'No title')}\n"
+                f"  Author: {author}\n"
+                f"  Reviewers: {', '.join(reviewers) if reviewers else 'None assigned'}\n"
+                f"  Keywords: {', '.join(title_matches)}\n"
+                f"  URL: {pr_url}"
+            )
+            alert(alert_msg)
+            
+            alert_buffer.add(
+                source="github",
+                company=company,
+                title=f"[{signal_type}] PR #{pr_number}: {pr.get('title', '')[:80]}",
+                message=f"Open pull request by {author} - early localization signal",
+                keywords=title_matches,
+                url=pr_url,
+                metadata={
+                    "pr_number": pr_number, 
+                    "author": author, 
+                    "signal_type": signal_type,
+                    "reviewers": reviewers,
+                    "detected_languages": title_matches
+                }
+            )
+            
+            alert_count += 1
         
     except Exception as e:
         log(f"Error checking PRs for {org}/{repo}: {e}", "ERROR")
@@ -271,25 +416,45 @@ def check_github_prs(company: str, org: str, repo: str) -> int:
 def check_all_github(targets: List[Dict]) -> int:
     """Check all configured GitHub repositories."""
     log("Starting GitHub checks...")
-    last_commits = load_json(config.LAST_COMMITS_FILE)
-    total_alerts = 0
-    repos_checked = 0
+    last_commits = load_state("last_commits", config.LAST_COMMITS_FILE)
+    pr_states = load_state("pr_state")
+    state_lock = threading.Lock()
+    
+    jobs = [
+        (target.get("company", "Unknown"), target["github_org"], repo)
+        for target in targets
+        if target.get("github_org")
+        for repo in target.get("github_repos", [])
+    ]
     
-    for target in targets:
-        company = target.get("company", "Unknown")
-        org = target.get("github_org")
-        repos = target.get("github_repos", [])
+    def check_repo(job) -> int:
+        company, org, repo = job
+        repo_key = f"{company}/{org}/{repo}"
+        with state_lock:
+            repo_commits = {repo_key: last_commits[repo_key]} if repo_key in last_commits else {}
+            repo_pr_states = {repo_key: pr_states[repo_key]} if repo_key in pr_states else {}
         
-        if not org or not repos:
-            continue
+        alerts = check_github_repo(company, org, repo, repo_commits)
+        pr_alerts = check_github_prs(company, org, repo, repo_pr_states)
         
-        for repo in repos:
-            alerts = check_github_repo(company, org, repo, last_commits)
-            pr_alerts = check_github_prs(company, org, repo)
-            total_alerts += alerts + pr_alerts
-            repos_checked += 1
-            time.sleep(config.REQUEST_DELAY)
+        with state_lock:
+            last_commits.update(repo_commits)
+            pr_states.update(repo_pr_states)
+        
+        # Quiet repos are persisted right away so a crash mid-cycle doesn't
+        # redo them. Repos with alerts wait for the final save, after the
+        # alerts they produced have been flushed.
+        if not alerts and not pr_alerts:
+            state_set_many(
+                [("last_commits", key, value) for key, value in repo_commits.items()]
+                + [("pr_state", key, value) for key, value in repo_pr_states.items()]
+            )
+        return alerts + pr_alerts
+    
+    total_alerts = sum(run_parallel(check_repo, jobs, config.GITHUB_MAX_WORKERS, pool="github"))
     
-    save_json(config.LAST_COMMITS_FILE, last_commits)
-    log(f"GitHub checks complete. Checked {repos_checked} repos, found {total_alerts} alerts.")
+    alert_buffer.flush()
+    save_state(last_commits)
+    save_state(pr_states)
+    log(f"GitHub checks complete. Checked {len(jobs)} repos, found {total_alerts} alerts.")
     return total_alerts
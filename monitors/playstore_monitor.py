@@ -3,13 +3,16 @@ Google Play Store Language Monitoring
 Detects new language support added to apps.
 """
 
+import threading
 import time
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 
 import config
 from .common import (
-    log, alert, load_json, save_json
+    log, alert, alert_buffer, run_parallel, RateLimiter
 )
+from .state import load_state, save_state
 
 try:
     from google_play_scraper import app as gplay_app
@@ -17,11 +20,50 @@ try:
 except ImportError:
     GPLAY_AVAILABLE = False
 
-try:
-    import storage
-    DB_AVAILABLE = True
-except:
-    DB_AVAILABLE = False
+# Shared by all package and language workers so concurrency doesn't
+# raise the request rate against the store.
+_play_store_limiter = RateLimiter(config.PLAY_STORE_REQUESTS_PER_SECOND)
+
+
+@lru_cache(maxsize=1024)
+def fetch_app_listing(package_id: str, lang: str) -> Optional[Dict]:
+    """
+    Fetch a Play Store listing. Cached for the duration of a cycle so
+    companies sharing a package only hit the store once; cleared by
+    check_all_play_store.
+    """
+    _play_store_limiter.wait()
+    return gplay_app(package_id, lang=lang, country='us')
+
+
+PLAY_STORE_TEST_LANGS = ["en", "es", "fr", "de", "ja", "ko", "zh", "pt", "ru", "ar", "hi", "it", "nl", "pl", "tr", "vi", "th", "id"]
+
+
+def probe_play_store_languages(package_id: str, langs: List[str]) -> Set[str]:
+    """
+    Return the subset of `langs` the app has a listing description for.
+    Probes run concurrently on a small thread pool.
+    """
+    def has_listing(lang: str) -> bool:
+        try:
+            lang_app = fetch_app_listing(package_id, lang)
+            return bool(lang_app and lang_app.get('description'))
+        except:
+            return False
+    
+    results = run_parallel(has_listing, langs, config.PLAY_STORE_LANG_WORKERS, pool="playstore-langs")
+    return {lang for lang, found in zip(langs, results) if found}
+
+
+def get_package_state(stored_langs: Dict, package_id: str) -> Dict:
+    """
+    Get the stored state for a package as a dict ({"langs": [...], "version": ..., "updated": ...}).
+    Older state files stored just the list of languages.
+    """
+    state = stored_langs.get(package_id)
+    if isinstance(state, list):
+        return {"langs": state}
+    return state or {}
 
 
 def check_play_store_package(company: str, package_id: str, stored_langs: Dict) -> int:
@@ -35,7 +77,7 @@ def check_play_store_package(company: str, package_id: str, stored_langs: Dict)
     alert_count = 0
     
     try:
-        app_info = gplay_app(package_id, lang='en', country='us')
+        app_info = fetch_app_listing(package_id, 'en')
         
         if not app_info:
             log(f"Could not fetch Play Store info for {package_id}", "WARNING")
@@ -44,19 +86,26 @@ def check_play_store_package(company: str, package_id: str, stored_langs: Dict)
         app_title = app_info.get('title', package_id)
         installs = app_info.get('installs', 'Unknown')
         
-        previous_langs = set(stored_langs.get(package_id, []))
+        package_state = get_package_state(stored_langs, package_id)
+        previous_langs = set(package_state.get("langs", []))
+        release = {"version": app_info.get('version'), "updated": app_info.get('updated')}
         
-        test_langs = ["en", "es", "fr", "de", "ja", "ko", "zh", "pt", "ru", "ar", "hi", "it", "nl", "pl", "tr", "vi", "th", "id"]
-        current_langs = set()
+        # Listing translations can ship without a release, so an unchanged
+        # release only throttles probing to once per PLAY_STORE_REPROBE_INTERVAL.
+        probed_recently = time.time() - package_state.get("probed", 0) < config.PLAY_STORE_REPROBE_INTERVAL
+        if previous_langs and release["updated"] and probed_recently and all(
+            package_state.get(field) == value for field, value in release.items()
+        ):
+            return 0
         
-        for lang in test_langs:
-            try:
-                lang_app = gplay_app(package_id, lang=lang, country='us')
-                if lang_app and lang_app.get('description'):
-                    current_langs.add(lang)
-                time.sleep(0.3)
-            except:
-                pass
+        # The scraper exposes no supported-locale list, so languages are found
+        # by probing listings. Languages seen in earlier cycles are kept rather
+        # than re-probed, and the English listing was fetched above.
+        current_langs = set(previous_langs)
+        if app_info.get('description'):
+            current_langs.add('en')
+        to_probe = [lang for lang in PLAY_STORE_TEST_LANGS if lang not in current_langs]
+        current_langs |= probe_play_store_languages(package_id, to_probe)
         
         new_langs = current_langs - previous_langs
         
@@ -76,29 +125,25 @@ def check_play_store_package(company: str, package_id: str, stored_langs: Dict)
             )
             alert(alert_msg)
             
-            if DB_AVAILABLE:
-                try:
-                    storage.save_alert(
-                        source="playstore",
-                        company=company,
-                        title=f"[{signal_type}] {app_title}: +{len(new_langs_list)} languages",
-                        message=f"Added: {', '.join(new_langs_list)}. Total: {len(current_langs)} languages. {installs} installs.",
-                        keywords=new_langs_list,
-                        url=play_url,
-                        metadata={
-                            "package": package_id,
-                            "signal_type": signal_type,
-                            "new_langs": new_langs_list,
-                            "total_langs": len(current_langs),
-                            "previous_lang_count": len(previous_langs)
-                        }
-                    )
-                except Exception as e:
-                    log(f"Failed to save Play Store alert: {e}", "WARNING")
+            alert_buffer.add(
+                source="playstore",
+                company=company,
+                title=f"[{signal_type}] {app_title}: +{len(new_langs_list)} languages",
+                message=f"Added: {', '.join(new_langs_list)}. Total: {len(current_langs)} languages. {installs} installs.",
+                keywords=new_langs_list,
+                url=play_url,
+                metadata={
+                    "package": package_id,
+                    "signal_type": signal_type,
+                    "new_langs": new_langs_list,
+                    "total_langs": len(current_langs),
+                    "previous_lang_count": len(previous_langs)
+                }
+            )
             
             alert_count += 1
         
-        stored_langs[package_id] = list(current_langs)
+        stored_langs[package_id] = {"langs": list(current_langs), **release, "probed": time.time()}
         
     except Exception as e:
         log(f"Error checking Play Store for {package_id}: {e}", "WARNING")
@@ -113,21 +158,32 @@ def check_all_play_store(targets: List[Dict]) -> int:
         return 0
     
     log("Starting Play Store checks...")
-    stored_langs = load_json(config.PLAY_STORE_LANGS_FILE)
-    total_alerts = 0
-    packages_checked = 0
+    fetch_app_listing.cache_clear()
+    stored_langs = load_state("play_store_langs", config.PLAY_STORE_LANGS_FILE)
+    state_lock = threading.Lock()
     
+    # State is per package, so one job per package: the first company
+    # listing it gets the alert, as it would in a sequential run.
+    packages = {}
     for target in targets:
-        company = target.get("company", "Unknown")
-        package_id = target.get("play_package")
+        if target.get("play_package"):
+            packages.setdefault(target["play_package"], target.get("company", "Unknown"))
+    jobs = [(company, package_id) for package_id, company in packages.items()]
+    
+    def check_package(job) -> int:
+        company, package_id = job
+        with state_lock:
+            package_langs = {package_id: stored_langs[package_id]} if package_id in stored_langs else {}
         
-        if not package_id:
-            continue
+        alerts = check_play_store_package(company, package_id, package_langs)
         
-        alerts = check_play_store_package(company, package_id, stored_langs)
-        total_alerts += alerts
-        packages_checked += 1
+        with state_lock:
+            stored_langs.update(package_langs)
+        return alerts
+    
+    total_alerts = sum(run_parallel(check_package, jobs, config.PLAY_STORE_MAX_WORKERS, pool="playstore"))
     
-    save_json(config.PLAY_STORE_LANGS_FILE, stored_langs)
-    log(f"Play Store checks complete. Checked {packages_checked} packages, found {total_alerts} alerts.")
+    save_state(stored_langs)
+    alert_buffer.flush()
+    log(f"Play Store checks complete. Checked {len(jobs)} packages, found {total_alerts} alerts.")
     return total_alerts
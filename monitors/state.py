@@ -0,0 +1,200 @@
+"""
+Persistent monitor state in SQLite.
+Each namespace (last_commits, doc_hashes, ...) is a set of key/value rows,
+so a cycle writes only the keys it changed instead of rewriting a JSON file.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Iterable, Optional, Set, Tuple
+
+import config
+
+# Imported by monitors.common, so this module logs directly rather than
+# through common.log.
+logger = logging.getLogger(__name__)
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_path: Optional[str] = None
+_lock = threading.RLock()
+
+
+class StateDict(dict):
+    """A namespace loaded from the state DB that records which keys changed."""
+
+    def __init__(self, namespace: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namespace = namespace
+        self.dirty: Set[str] = set()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self or self[key] != value:
+            self.dirty.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.dirty.add(key)
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def pop(self, key: str, *default) -> Any:
+        if key in self:
+            self.dirty.add(key)
+        return super().pop(key, *default)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+def get_state_connection() -> sqlite3.Connection:
+    """Open (once) the state DB in WAL mode and ensure the schema exists."""
+    global _conn, _conn_path
+    with _lock:
+        if _conn is None or _conn_path != config.STATE_DB_FILE:
+            if _conn is not None:
+                _conn.close()
+            os.makedirs(os.path.dirname(config.STATE_DB_FILE) or ".", exist_ok=True)
+            _conn = sqlite3.connect(config.STATE_DB_FILE, check_same_thread=False)
+            _conn.execute("PRAGMA journal_mode=WAL")
+            _conn.execute("PRAGMA synchronous=NORMAL")
+            _conn.execute("""
+                CREATE TABLE IF NOT EXISTS state (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT,
+                    PRIMARY KEY (namespace, key)
+                )
+            """)
+            _conn.commit()
+            _conn_path = config.STATE_DB_FILE
+        return _conn
+
+
+def state_get(namespace: str, key: str, default: Any = None) -> Any:
+    with _lock:
+        row = get_state_connection().execute(
+            "SELECT value FROM state WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+    return json.loads(row[0]) if row else default
+
+
+def state_set(namespace: str, key: str, value: Any) -> None:
+    with _lock:
+        conn = get_state_connection()
+        with conn:
+            conn.execute(
+                "INSERT INTO state (namespace, key, value) VALUES (?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                (namespace, key, json.dumps(value))
+            )
+
+
+def state_get_raw(namespace: str, key: str) -> Any:
+    """Stored value without JSON decoding: bytes for state_set_bytes values, str otherwise."""
+    with _lock:
+        row = get_state_connection().execute(
+            "SELECT value FROM state WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def state_set_bytes(namespace: str, key: str, value: bytes) -> None:
+    """Store raw bytes (as a BLOB), e.g. compressed text."""
+    with _lock:
+        conn = get_state_connection()
+        with conn:
+            conn.execute(
+                "INSERT INTO state (namespace, key, value) VALUES (?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                (namespace, key, sqlite3.Binary(value))
+            )
+
+
+def state_set_many(rows: Iterable[Tuple[str, str, Any]]) -> None:
+    """
+    Upsert (namespace, key, value) rows in a single transaction.
+    bytes values are stored as BLOBs (like state_set_bytes), others as JSON.
+    """
+    params = [
+        (namespace, key, sqlite3.Binary(value) if isinstance(value, bytes) else json.dumps(value))
+        for namespace, key, value in rows
+    ]
+    if not params:
+        return
+    with _lock:
+        conn = get_state_connection()
+        with conn:
+            conn.executemany(
+                "INSERT INTO state (namespace, key, value) VALUES (?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                params
+            )
+
+
+def state_prune(namespace: str, field: str, cutoff: float) -> int:
+    """
+    Delete rows of a namespace whose JSON value has `field` below `cutoff`
+    (or lacks it). Returns the number of rows removed.
+    """
+    with _lock:
+        conn = get_state_connection()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM state WHERE namespace = ? "
+                "AND COALESCE(json_extract(value, '$.' || ?), 0) < ?",
+                (namespace, field, cutoff)
+            )
+    return cursor.rowcount
+
+
+def load_state(namespace: str, legacy_file: Optional[str] = None) -> StateDict:
+    """
+    Load every key of a namespace.
+    If the namespace is empty and `legacy_file` exists, its JSON contents are
+    imported (and written on the next save_state).
+    """
+    with _lock:
+        rows = get_state_connection().execute(
+            "SELECT key, value FROM state WHERE namespace = ?", (namespace,)
+        ).fetchall()
+    data = StateDict(namespace, {key: json.loads(value) for key, value in rows})
+
+    if not rows and legacy_file and os.path.exists(legacy_file):
+        try:
+            with open(legacy_file, 'r') as f:
+                data.update(json.load(f))
+            logger.info(f"Imported {len(data)} {namespace} entries from {legacy_file}")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Error loading {legacy_file}: {e}")
+    return data
+
+
+def save_state(data: StateDict) -> None:
+    """Upsert/delete the keys changed since load in a single transaction."""
+    with _lock:
+        dirty, data.dirty = data.dirty, set()
+        if not dirty:
+            return
+        try:
+            conn = get_state_connection()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO state (namespace, key, value) VALUES (?, ?, ?) "
+                    "ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                    [(data.namespace, key, json.dumps(data[key])) for key in dirty if key in data]
+                )
+                conn.executemany(
+                    "DELETE FROM state WHERE namespace = ? AND key = ?",
+                    [(data.namespace, key) for key in dirty if key not in data]
+                )
+        except sqlite3.Error as e:
+            data.dirty |= dirty
+            logger.error(f"Error saving {data.namespace} state: {e}")
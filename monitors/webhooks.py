@@ -5,21 +5,54 @@ Allows pushing alerts to external services like Zapier, Make.com, or custom endp
 
 import os
 import json
-import requests
+import queue
+import time
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 import config
-from .common import log, load_json, save_json
+from .common import log, post_json, load_json, save_json, run_parallel, next_batch
+
+# Alerts queued by send_alert_to_webhooks are posted by a background worker
+# that collects alerts raised close together, so webhooks registered with
+# batch=True get them in one request.
+WEBHOOK_BATCH_WINDOW = 2.0
+WEBHOOK_BATCH_MAX = 50
+_webhook_queue: "queue.Queue[Tuple[Optional[str], Dict]]" = queue.Queue(maxsize=1000)
+_webhook_worker: Optional[threading.Thread] = None
+_webhook_worker_lock = threading.Lock()
+
+# A queued alert already delivered to a webhook (same signal, URL and
+# title) is not sent to it again within this window, e.g. for repos shared
+# by several targets. Direct send_webhook calls are always sent.
+WEBHOOK_DEDUP_SECONDS = 600
+_recent_deliveries: Dict[Tuple, float] = {}
+_recent_deliveries_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _parse_webhooks(path: str, mtime_ns: int, size: int) -> List[Dict]:
+    """Parse the webhooks file. Cached per modification time and size."""
+    return load_json(path).get("webhooks", [])
 
 
 def get_webhooks() -> List[Dict]:
-    """Get all registered webhooks."""
-    data = load_json(config.WEBHOOKS_FILE)
-    return data.get("webhooks", [])
+    """
+    Get all registered webhooks.
+    The file is only re-parsed when it changes on disk.
+    """
+    try:
+        st = os.stat(config.WEBHOOKS_FILE)
+    except OSError:
+        return []
+    webhooks = _parse_webhooks(config.WEBHOOKS_FILE, st.st_mtime_ns, st.st_size)
+    return [dict(webhook) for webhook in webhooks]
 
 
-def register_webhook(name: str, url: str, events: List[str] = None, headers: Dict = None) -> bool:
+def register_webhook(name: str, url: str, events: List[str] = None, headers: Dict = None,
+                     batch: bool = False) -> bool:
     """
     Register a new webhook endpoint.
     
@@ -29,6 +62,8 @@ def register_webhook(name: str, url: str, events: List[str] = None, headers: Dic
         events: List of event types to trigger on (e.g., ["NEW_LANG_FILE", "NEW_HREFLANG"])
                 If None, triggers on all events
         headers: Optional custom headers to include
+        batch: Send queued alerts raised close together as one
+               {"batch": true, "events": [...]} request instead of one per alert
     
     Returns:
         True if registered successfully
@@ -42,6 +77,7 @@ def register_webhook(name: str, url: str, events: List[str] = None, headers: Dic
             existing["url"] = url
             existing["events"] = events
             existing["headers"] = headers or {}
+            existing["batch"] = batch
             existing["updated_at"] = datetime.now().isoformat()
         else:
             webhooks.append({
@@ -49,6 +85,7 @@ def register_webhook(name: str, url: str, events: List[str] = None, headers: Dic
                 "url": url,
                 "events": events,
                 "headers": headers or {},
+                "batch": batch,
                 "created_at": datetime.now().isoformat(),
                 "enabled": True
             })
@@ -76,9 +113,85 @@ def remove_webhook(name: str) -> bool:
         return False
 
 
+def _post_webhook(webhook: Dict, payload: Dict) -> bool:
+    """POST a payload to one webhook. Returns True on a 2xx response."""
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "LocalizationMonitor/1.0"
+    }
+    headers.update(webhook.get("headers", {}))
+    
+    try:
+        response = post_json(webhook["url"], payload, headers=headers, timeout=10)
+        
+        if response.status_code < 300:
+            log(f"Webhook sent to {webhook['name']}: {response.status_code}")
+            return True
+        log(f"Webhook {webhook['name']} returned {response.status_code}", "WARNING")
+    except Exception as e:
+        log(f"Error sending to webhook {webhook['name']}: {e}", "WARNING")
+    return False
+
+
+def _event_payload(alert_data: Dict, signal_type: Optional[str]) -> Dict:
+    return {
+        "event": signal_type or "ALERT",
+        "timestamp": datetime.now().isoformat(),
+        "data": alert_data
+    }
+
+
+def _deliver(events: List[Tuple[Optional[str], Dict]], dedup: bool = False) -> int:
+    """
+    Send (signal_type, payload) events to all matching webhooks.
+    Each alert is its own request, except that a webhook registered with
+    batch=True gets several matching alerts as one {"batch": true, "events": [...]}.
+    Endpoints are posted to concurrently, so one slow endpoint doesn't
+    delay the others. With `dedup`, alerts delivered to a webhook within
+    the last WEBHOOK_DEDUP_SECONDS are skipped for it.
+    Returns the number of requests that succeeded.
+    """
+    now = time.monotonic()
+    deliveries = []
+    
+    with _recent_deliveries_lock:
+        for key in [key for key, expires in _recent_deliveries.items() if expires <= now]:
+            del _recent_deliveries[key]
+        
+        for webhook in get_webhooks():
+            if not webhook.get("enabled", True):
+                continue
+            
+            allowed_events = webhook.get("events")
+            matching = {}
+            for signal_type, payload in events:
+                if allowed_events and signal_type and signal_type not in allowed_events:
+                    continue
+                data = payload.get("data") or {}
+                key = (webhook.get("url"), signal_type, data.get("url"), data.get("title"))
+                if not (dedup and key in _recent_deliveries):
+                    matching.setdefault(key, payload)
+            
+            payloads = list(matching.values())
+            if len(payloads) > 1 and webhook.get("batch"):
+                deliveries.append((webhook, {"batch": True, "events": payloads}, list(matching)))
+            else:
+                deliveries.extend((webhook, payload, [key]) for key, payload in matching.items())
+    
+    results = run_parallel(lambda delivery: _post_webhook(delivery[0], delivery[1]), deliveries,
+                           config.WEBHOOK_MAX_WORKERS, pool="webhooks")
+    
+    expires = time.monotonic() + WEBHOOK_DEDUP_SECONDS
+    with _recent_deliveries_lock:
+        for (_, _, keys), sent in zip(deliveries, results):
+            if sent:
+                _recent_deliveries.update(dict.fromkeys(keys, expires))
+    return sum(results)
+
+
 def send_webhook(alert_data: Dict, signal_type: str = None) -> int:
     """
-    Send an alert to all matching webhooks.
+    Send an alert to all matching webhooks immediately.
     
     Args:
         alert_data: Dictionary containing alert information
@@ -87,47 +200,42 @@ def send_webhook(alert_data: Dict, signal_type: str = None) -> int:
     Returns:
         Number of webhooks successfully notified
     """
-    webhooks = get_webhooks()
-    success_count = 0
-    
-    for webhook in webhooks:
-        if not webhook.get("enabled", True):
-            continue
-        
-        allowed_events = webhook.get("events")
-        if allowed_events and signal_type and signal_type not in allowed_events:
-            continue
-        
+    return _deliver([(signal_type, _event_payload(alert_data, signal_type))])
+
+
+def _start_webhook_worker() -> None:
+    global _webhook_worker
+    with _webhook_worker_lock:
+        if _webhook_worker is None:
+            _webhook_worker = threading.Thread(target=_webhook_worker_loop, name="webhook-sender", daemon=True)
+            _webhook_worker.start()
+            # Plain atexit hooks run after concurrent.futures has stopped
+            # accepting work, which the worker needs to post. Hooks registered
+            # here run earlier, last registered first.
+            threading._register_atexit(_flush_at_exit)
+
+
+def _flush_at_exit() -> None:
+    """Wait for queued alerts to be posted before the interpreter exits."""
+    _webhook_queue.join()
+
+
+def _webhook_worker_loop() -> None:
+    while True:
+        events = next_batch(_webhook_queue, WEBHOOK_BATCH_WINDOW, WEBHOOK_BATCH_MAX)
         try:
-            payload = {
-                "event": signal_type or "ALERT",
-                "timestamp": datetime.now().isoformat(),
-                "data": alert_data
-            }
-            
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "LocalizationMonitor/1.0"
-            }
-            headers.update(webhook.get("headers", {}))
-            
-            response = requests.post(
-                webhook["url"],
-                json=payload,
-                headers=headers,
-                timeout=10
-            )
-            
-            if response.status_code < 300:
-                success_count += 1
-                log(f"Webhook sent to {webhook['name']}: {response.status_code}")
-            else:
-                log(f"Webhook {webhook['name']} returned {response.status_code}", "WARNING")
-                
+            _deliver(events, dedup=True)
         except Exception as e:
-            log(f"Error sending to webhook {webhook['name']}: {e}", "WARNING")
-    
-    return success_count
+            log(f"Failed to send webhook batch: {e}", "WARNING")
+        finally:
+            for _ in events:
+                _webhook_queue.task_done()
+
+
+def flush_webhooks() -> None:
+    """Block until every queued alert has been posted."""
+    if _webhook_worker is not None:
+        _webhook_queue.join()
 
 
 def send_alert_to_webhooks(
@@ -138,9 +246,12 @@ def send_alert_to_webhooks(
     keywords: List[str],
     url: str,
     metadata: Dict = None
-) -> int:
+) -> bool:
     """
-    Convenience function to send a full alert to all webhooks.
+    Queue a full alert for all webhooks.
+    Alerts are posted in batches by a background worker; call
+    flush_webhooks() to wait for delivery.
+    Returns False if the queue is full and the alert was dropped.
     """
     signal_type = None
     if metadata and isinstance(metadata, dict):
@@ -156,4 +267,10 @@ def send_alert_to_webhooks(
         "metadata": metadata or {}
     }
     
-    return send_webhook(alert_data, signal_type)
+    _start_webhook_worker()
+    try:
+        _webhook_queue.put_nowait((signal_type, _event_payload(alert_data, signal_type)))
+        return True
+    except queue.Full:
+        log("Webhook queue full, dropping alert", "WARNING")
+        return False
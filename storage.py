@@ -4,82 +4,212 @@ Uses PostgreSQL via psycopg2.
 """
 
 import os
+import re
+import copy
 import json
-import psycopg2
-from psycopg2.extras import RealDictCursor, Json
+import time
+import atexit
+import functools
+import threading
+from contextlib import contextmanager
+from psycopg2.extras import RealDictCursor, Json, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import Callable, Iterator, List, Dict, Optional, Any
 
 import config
 
 DATABASE_URL = config.DATABASE_URL
 
-def get_connection():
-    """Get a database connection."""
-    return psycopg2.connect(DATABASE_URL)
+# Columns returned for alert rows. Listed explicitly so derived columns
+# such as search_tsv are never shipped to callers.
+ALERT_COLUMNS = "id, created_at, source, company, title, message, keywords, url, metadata"
+# Narrower projection for list views that never render message or keywords.
+ALERT_LIST_COLUMNS = "id, created_at, source, company, title, url, metadata"
+
+# One pool per process, created on first use. Dashboard request threads and
+# monitor threads borrow connections instead of opening one per query.
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+# ThreadedConnectionPool raises PoolError once DB_POOL_MAX connections are
+# out; checkouts take a slot first so callers wait for one to come back.
+_pool_slots = threading.BoundedSemaphore(config.DB_POOL_MAX)
+
+def _get_pool() -> ThreadedConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadedConnectionPool(config.DB_POOL_MIN, config.DB_POOL_MAX, dsn=DATABASE_URL)
+            atexit.register(_pool.closeall)
+        return _pool
+
+@contextmanager
+def get_connection() -> Iterator[Any]:
+    """Borrow a database connection from the pool and return it afterwards."""
+    pool = _get_pool()
+    with _pool_slots:
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
+
+# Rows fetched per round trip by named (server-side) cursors.
+SERVER_CURSOR_ITERSIZE = 1000
+
+@contextmanager
+def get_cursor(dict_cursor: bool = False, name: Optional[str] = None,
+               readonly: bool = False) -> Iterator[Any]:
+    """
+    Yield a cursor on a pooled connection. The transaction is committed when
+    the block exits normally and rolled back if it raises.
+
+    A `name` opens a server-side cursor: iterating it streams rows in
+    batches of SERVER_CURSOR_ITERSIZE instead of buffering the whole result.
+    `readonly` runs the block in autocommit mode, so plain SELECTs skip the
+    BEGIN/COMMIT round trips (named cursors need a transaction and ignore it).
+    """
+    with get_connection() as conn:
+        autocommit = readonly and not name
+        if autocommit:
+            conn.autocommit = True
+        cur = conn.cursor(name=name, cursor_factory=RealDictCursor if dict_cursor else None)
+        if name:
+            cur.itersize = SERVER_CURSOR_ITERSIZE
+        try:
+            yield cur
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            cur.close()
+            if autocommit and not conn.closed:
+                conn.autocommit = False
+
+def _fetch_dicts(cur) -> List[Dict]:
+    """
+    Fetch all rows of a plain cursor as dicts. Zipping tuples with the column
+    names builds one dict per row, where RealDictCursor plus dict() builds two.
+    """
+    columns = [col.name for col in cur.description]
+    return [dict(zip(columns, row)) for row in cur.fetchall()]
 
 def init_database():
     """Initialize the database schema."""
-    conn = get_connection()
-    cur = conn.cursor()
-    
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS alerts (
-            id SERIAL PRIMARY KEY,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            source VARCHAR(50) NOT NULL,
-            company VARCHAR(100) NOT NULL,
-            title VARCHAR(500),
-            message TEXT,
-            keywords TEXT,
-            url TEXT,
-            metadata JSONB
-        )
-    """)
-    
-    cur.execute("""
-        CREATE INDEX IF NOT EXISTS idx_alerts_created_at ON alerts(created_at DESC)
-    """)
-    cur.execute("""
-        CREATE INDEX IF NOT EXISTS idx_alerts_company ON alerts(company)
-    """)
-    cur.execute("""
-        CREATE INDEX IF NOT EXISTS idx_alerts_source ON alerts(source)
-    """)
-    
-    conn.commit()
-    cur.close()
-    conn.close()
+    with get_cursor() as cur:
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS alerts (
+                id SERIAL PRIMARY KEY,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                source VARCHAR(50) NOT NULL,
+                company VARCHAR(100) NOT NULL,
+                title VARCHAR(500),
+                message TEXT,
+                keywords TEXT,
+                url TEXT,
+                metadata JSONB
+            )
+        """)
+        
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_created_at ON alerts(created_at DESC)
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_company ON alerts(company)
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_source ON alerts(source)
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_src_comp_created ON alerts(source, company, created_at DESC)
+        """)
+        cur.execute("""
+            ALTER TABLE alerts ADD COLUMN IF NOT EXISTS search_tsv tsvector
+            GENERATED ALWAYS AS (to_tsvector('simple',
+                coalesce(company, '') || ' ' || coalesce(title, '') || ' ' ||
+                coalesce(message, '') || ' ' || coalesce(keywords, ''))) STORED
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_search_tsv ON alerts USING GIN (search_tsv)
+        """)
+        # Containment (metadata @> ...) lookups use the GIN index; the
+        # expression index serves per-signal-type counts.
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_metadata_gin ON alerts USING GIN (metadata jsonb_path_ops)
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_signal_type ON alerts ((metadata->>'signal_type'))
+            WHERE source = 'github'
+        """)
+        # Contributor lookups filter github rows by author, newest first.
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_author ON alerts ((metadata->>'author'), created_at DESC)
+            WHERE source = 'github' AND metadata->>'author' IS NOT NULL
+        """)
 
 def save_alert(source: str, company: str, title: str, message: str, 
                keywords: List[str], url: str, metadata: Optional[Dict] = None) -> int:
     """Save an alert to the database and return the ID."""
-    conn = get_connection()
-    cur = conn.cursor()
+    with get_cursor() as cur:
+        cur.execute("""
+            INSERT INTO alerts (source, company, title, message, keywords, url, metadata)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            RETURNING id
+        """, (source, company, title, message, ', '.join(keywords), url, 
+              Json(metadata) if metadata else None))
+        result = cur.fetchone()
     
-    cur.execute("""
-        INSERT INTO alerts (source, company, title, message, keywords, url, metadata)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        RETURNING id
-    """, (source, company, title, message, ', '.join(keywords), url, 
-          Json(metadata) if metadata else None))
+    return result[0] if result else 0
+
+def save_alerts_bulk(alerts: List[Dict]) -> int:
+    """
+    Save many alerts with a single multi-row INSERT.
+    Each dict takes the same fields as save_alert(). Returns the number saved.
+    """
+    if not alerts:
+        return 0
+    
+    rows = [
+        (a["source"], a["company"], a.get("title"), a.get("message"),
+         ', '.join(a.get("keywords") or []), a.get("url"),
+         Json(a["metadata"]) if a.get("metadata") else None)
+        for a in alerts
+    ]
     
-    result = cur.fetchone()
-    alert_id = result[0] if result else 0
-    conn.commit()
-    cur.close()
-    conn.close()
+    with get_cursor() as cur:
+        execute_values(cur, """
+            INSERT INTO alerts (source, company, title, message, keywords, url, metadata)
+            VALUES %s
+        """, rows, page_size=1000)
     
-    return alert_id
+    return len(rows)
+
+_SEARCH_TERM_RE = re.compile(r"\w+")
+_PLAIN_SEARCH_RE = re.compile(r"[\w\s]+")
+
+def _prefix_tsquery(search: str) -> Optional[str]:
+    """
+    Turn free text into a tsquery matching every word as a prefix, e.g.
+    'shop:* & i18n:*'. Returns None for text with punctuation: the tsvector
+    keeps file names and paths ("ja.json", "locales/fr.json") as whole
+    tokens, so those searches must use substring matching instead.
+    """
+    if not _PLAIN_SEARCH_RE.fullmatch(search):
+        return None
+    terms = _SEARCH_TERM_RE.findall(search.lower())
+    return " & ".join(f"{term}:*" for term in terms) or None
 
 def get_alerts(limit: int = 100, source: Optional[str] = None, 
                company: Optional[str] = None, search: Optional[str] = None,
-               signal_type: Optional[str] = None) -> List[Dict]:
-    """Get alerts with optional filtering."""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-    
-    query = "SELECT * FROM alerts WHERE 1=1"
+               signal_type: Optional[str] = None,
+               columns: str = ALERT_COLUMNS) -> List[Dict]:
+    """
+    Get alerts with optional filtering.
+    `columns` is ALERT_COLUMNS (full rows) or ALERT_LIST_COLUMNS.
+    """
+    query = f"SELECT {columns} FROM alerts WHERE 1=1"
     params = []
     
     if source:
@@ -90,253 +220,297 @@ def get_alerts(limit: int = 100, source: Optional[str] = None,
         query += " AND company = %s"
         params.append(company)
     
-    if search:
-        query += " AND (company ILIKE %s OR title ILIKE %s OR message ILIKE %s OR keywords ILIKE %s)"
-        search_pattern = f"%{search}%"
-        params.extend([search_pattern, search_pattern, search_pattern, search_pattern])
+    if search and search.strip():
+        search_query = _prefix_tsquery(search)
+        if search_query:
+            query += " AND search_tsv @@ to_tsquery('simple', %s)"
+            params.append(search_query)
+        else:
+            query += " AND (company ILIKE %s OR title ILIKE %s OR message ILIKE %s OR keywords ILIKE %s)"
+            search_pattern = f"%{search}%"
+            params.extend([search_pattern, search_pattern, search_pattern, search_pattern])
     
     if signal_type:
-        query += " AND metadata->>'signal_type' = %s"
-        params.append(signal_type)
+        query += " AND metadata @> %s"
+        params.append(Json({"signal_type": signal_type}))
     
     query += " ORDER BY created_at DESC LIMIT %s"
     params.append(limit)
     
-    cur.execute(query, params)
-    alerts = cur.fetchall()
-    
-    cur.close()
-    conn.close()
-    
-    return [dict(a) for a in alerts]
+    with get_cursor(readonly=True) as cur:
+        cur.execute(query, params)
+        return _fetch_dicts(cur)
+
+def _ttl_cache(func: Callable) -> Callable:
+    """
+    Memoize a no-argument aggregate query for config.DASHBOARD_CACHE_TTL
+    seconds. Dashboard polling reuses the answer instead of re-running the
+    GROUP BY; callers get a copy, so mutating it never touches the cache.
+    Alerts are written by the monitor process, so dashboard aggregates may
+    lag new alerts by up to the TTL.
+    """
+    lock = threading.Lock()
+    entry: Dict[str, Any] = {"value": None, "expires": 0.0}
+
+    @functools.wraps(func)
+    def wrapper():
+        with lock:
+            if time.monotonic() >= entry["expires"]:
+                entry["value"] = func()
+                entry["expires"] = time.monotonic() + config.DASHBOARD_CACHE_TTL
+            return copy.deepcopy(entry["value"])
+
+    wrapper.cache_clear = lambda: entry.update(expires=0.0)
+    return wrapper
 
 def get_companies() -> List[str]:
-    """Get list of distinct companies with alerts."""
-    conn = get_connection()
-    cur = conn.cursor()
-    
-    cur.execute("SELECT DISTINCT company FROM alerts ORDER BY company")
-    companies = [row[0] for row in cur.fetchall()]
-    
-    cur.close()
-    conn.close()
-    
-    return companies
+    """
+    Get the sorted list of companies with GitHub alerts.
+    Derived from the (cached) companies summary rather than its own query.
+    """
+    return sorted(row['company'] for row in get_all_companies_summary())
 
+@_ttl_cache
 def get_alert_stats() -> Dict:
     """Get alert statistics (GitHub only)."""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-
-    cur.execute("""
-        SELECT
-            COUNT(*) as total,
-            COUNT(CASE WHEN source = 'github' THEN 1 END) as github_count
-        FROM alerts
-        WHERE source = 'github'
-    """)
-    result = cur.fetchone()
-    stats = dict(result) if result else {"total": 0, "github_count": 0}
-
-    cur.close()
-    conn.close()
+    with get_cursor(dict_cursor=True, readonly=True) as cur:
+        cur.execute("""
+            SELECT
+                COUNT(*) as total,
+                COUNT(CASE WHEN source = 'github' THEN 1 END) as github_count
+            FROM alerts
+            WHERE source = 'github'
+        """)
+        result = cur.fetchone()
 
-    return stats
+    return dict(result) if result else {"total": 0, "github_count": 0}
+
+# Rows deleted per transaction by prune_old_alerts.
+PRUNE_BATCH_SIZE = 10000
 
 def prune_old_alerts(days: int = 90) -> int:
-    """Delete alerts older than specified days. Returns count deleted."""
-    conn = get_connection()
-    cur = conn.cursor()
-    
-    cur.execute("""
-        DELETE FROM alerts 
-        WHERE created_at < NOW() - INTERVAL '%s days'
-    """, (days,))
-    
-    deleted = cur.rowcount
-    conn.commit()
-    cur.close()
-    conn.close()
+    """
+    Delete alerts older than specified days. Returns count deleted.
+    Deletes run in batches of PRUNE_BATCH_SIZE, each in its own short
+    transaction, so a large backlog never holds one long lock.
+    """
+    deleted = 0
+    while True:
+        with get_cursor() as cur:
+            cur.execute("""
+                DELETE FROM alerts
+                WHERE id IN (
+                    SELECT id FROM alerts
+                    WHERE created_at < NOW() - make_interval(days => %s)
+                    LIMIT %s
+                )
+            """, (days, PRUNE_BATCH_SIZE))
+            batch = cur.rowcount
+        deleted += batch
+        if batch < PRUNE_BATCH_SIZE:
+            break
     
     return deleted
 
 
 def get_company_alerts(company: str, limit: Optional[int] = None) -> List[Dict]:
     """Get all alerts for a specific company."""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-    
-    query = "SELECT * FROM alerts WHERE company = %s ORDER BY created_at DESC"
+    query = f"SELECT {ALERT_COLUMNS} FROM alerts WHERE company = %s ORDER BY created_at DESC"
     params = [company]
     
     if limit:
         query += " LIMIT %s"
         params.append(limit)
     
-    cur.execute(query, params)
-    alerts = cur.fetchall()
-    
-    cur.close()
-    conn.close()
-    
-    return [dict(a) for a in alerts]
+    with get_cursor(readonly=True) as cur:
+        cur.execute(query, params)
+        return _fetch_dicts(cur)
 
 
 def get_company_metrics(company: str) -> Dict:
-    """Get aggregated metrics for a company focused on GitHub i18n signals."""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-
-    cur.execute("""
-        SELECT
-            COUNT(*) as total_alerts,
-            COUNT(CASE WHEN source = 'github' THEN 1 END) as github_count,
-            COUNT(CASE WHEN metadata->>'signal_type' = 'NEW_LANG_FILE' THEN 1 END) as new_lang_files,
-            COUNT(CASE WHEN metadata->>'signal_type' = 'OPEN_PR' THEN 1 END) as open_prs,
-            MIN(created_at) as first_seen,
-            MAX(created_at) as last_activity
-        FROM alerts
-        WHERE company = %s AND source = 'github'
-    """, (company,))
-
-    result = cur.fetchone()
-    metrics = dict(result) if result else {
-        'total_alerts': 0,
-        'github_count': 0,
-        'new_lang_files': 0,
-        'open_prs': 0,
-        'first_seen': None,
-        'last_activity': None
-    }
-
-    cur.execute("""
-        SELECT DISTINCT metadata->>'signal_type' as signal_type
-        FROM alerts
-        WHERE company = %s AND source = 'github' AND metadata->>'signal_type' IS NOT NULL
-    """, (company,))
-    signal_types = [row['signal_type'] for row in cur.fetchall()]
-    metrics['signal_types'] = signal_types
-
-    cur.execute("""
-        SELECT metadata->'new_langs' as new_langs, metadata->'files' as files,
-               metadata->>'detected_languages' as detected_languages
-        FROM alerts
-        WHERE company = %s AND source = 'github'
-    """, (company,))
-
-    all_languages = set()
-    all_files = []
-    for row in cur.fetchall():
-        if row['new_langs']:
-            langs = row['new_langs']
-            if isinstance(langs, list):
-                all_languages.update(langs)
-        if row['detected_languages']:
-            try:
-                detected = row['detected_languages']
-                if isinstance(detected, list):
-                    all_languages.update(detected)
-            except:
-                pass
-        if row['files']:
-            files = row['files']
-            if isinstance(files, list):
-                all_files.extend(files)
-    metrics['detected_languages'] = sorted(list(all_languages))
-    metrics['localization_files'] = list(set(all_files))[:20]
-
-    cur.execute("""
-        SELECT DISTINCT metadata->>'author' as author
-        FROM alerts
-        WHERE company = %s AND source = 'github' AND metadata->>'author' IS NOT NULL
-        LIMIT 15
-    """, (company,))
-    authors = [row['author'] for row in cur.fetchall() if row['author']]
-    metrics['contributors'] = authors
-
-    cur.close()
-    conn.close()
-
+    """
+    Get aggregated metrics for a company focused on GitHub i18n signals.
+    Everything is computed in one round-trip over the company's alerts.
+    """
+    with get_cursor(dict_cursor=True, readonly=True) as cur:
+        cur.execute("""
+            WITH base AS (
+                SELECT created_at, metadata
+                FROM alerts
+                WHERE company = %s AND source = 'github'
+            ),
+            agg AS (
+                SELECT
+                    COUNT(*) as total_alerts,
+                    COUNT(*) as github_count,
+                    COUNT(*) FILTER (WHERE metadata->>'signal_type' = 'NEW_LANG_FILE') as new_lang_files,
+                    COUNT(*) FILTER (WHERE metadata->>'signal_type' = 'OPEN_PR') as open_prs,
+                    MIN(created_at) as first_seen,
+                    MAX(created_at) as last_activity,
+                    ARRAY_AGG(DISTINCT metadata->>'signal_type')
+                        FILTER (WHERE metadata->>'signal_type' IS NOT NULL) as signal_types
+                FROM base
+            )
+            SELECT
+                agg.*,
+                ARRAY(
+                    -- OPEN_PR alerts store keyword matches as detected_languages,
+                    -- so only other signals contribute that field.
+                    SELECT DISTINCT lang
+                    FROM base,
+                        LATERAL (VALUES
+                            (metadata->'new_langs'),
+                            (CASE WHEN metadata->>'signal_type' IS DISTINCT FROM 'OPEN_PR'
+                                  THEN metadata->'detected_languages' END)
+                        ) v(langs),
+                        LATERAL jsonb_array_elements_text(
+                            CASE WHEN jsonb_typeof(v.langs) = 'array' THEN v.langs ELSE '[]'::jsonb END
+                        ) lang
+                    ORDER BY lang
+                ) as detected_languages,
+                ARRAY(
+                    SELECT DISTINCT file
+                    FROM base,
+                        LATERAL jsonb_array_elements_text(
+                            CASE WHEN jsonb_typeof(metadata->'files') = 'array' THEN metadata->'files' ELSE '[]'::jsonb END
+                        ) file
+                    ORDER BY file
+                    LIMIT 20
+                ) as localization_files,
+                ARRAY(
+                    SELECT DISTINCT metadata->>'author'
+                    FROM base
+                    WHERE metadata->>'author' IS NOT NULL AND metadata->>'author' != ''
+                    ORDER BY 1
+                    LIMIT 15
+                ) as contributors
+            FROM agg
+        """, (company,))
+        metrics = dict(cur.fetchone())
+
+    metrics['signal_types'] = metrics['signal_types'] or []
     return metrics
 
 
 def get_company_timeline(company: str) -> List[Dict]:
     """Get chronological timeline of i18n events for a company."""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-
-    cur.execute("""
-        SELECT
-            id, created_at, source, title, message, keywords, url, metadata
-        FROM alerts
-        WHERE company = %s AND source = 'github'
-        ORDER BY created_at ASC
-    """, (company,))
-
-    alerts = cur.fetchall()
-    cur.close()
-    conn.close()
-
     timeline = []
     cumulative_languages = set()
+    # Re-sorted only when a language is added; rows in between share the list.
+    cumulative_sorted: List[str] = []
 
-    for alert in alerts:
-        metadata = alert.get('metadata') or {}
-        signal_type = metadata.get('signal_type', 'UNKNOWN')
-
-        new_langs = []
-        if metadata.get('new_langs'):
-            new_langs = metadata['new_langs'] if isinstance(metadata['new_langs'], list) else []
-        elif metadata.get('detected_languages'):
-            new_langs = metadata['detected_languages'] if isinstance(metadata['detected_languages'], list) else []
-
-        for lang in new_langs:
-            cumulative_languages.add(lang)
-
-        timeline.append({
-            'id': alert['id'],
-            'date': alert['created_at'],
-            'signal_type': signal_type,
-            'title': alert['title'],
-            'message': alert['message'],
-            'url': alert['url'],
-            'author': metadata.get('author'),
-            'files': metadata.get('files', []),
-            'languages_added': new_langs,
-            'cumulative_languages': sorted(list(cumulative_languages)),
-            'pr_number': metadata.get('pr_number'),
-            'reviewers': metadata.get('reviewers', [])
-        })
+    # Rows are streamed from a server-side cursor and turned into timeline
+    # entries as they arrive, so large companies never hold every raw row.
+    with get_cursor(dict_cursor=True, name='company_timeline') as cur:
+        cur.execute("""
+            SELECT
+                id, created_at, title, message, url, metadata
+            FROM alerts
+            WHERE company = %s AND source = 'github'
+            ORDER BY created_at ASC
+        """, (company,))
+        for alert in cur:
+            metadata = alert.get('metadata') or {}
+            signal_type = metadata.get('signal_type', 'UNKNOWN')
+
+            new_langs = []
+            if metadata.get('new_langs'):
+                new_langs = metadata['new_langs'] if isinstance(metadata['new_langs'], list) else []
+            elif metadata.get('detected_languages'):
+                new_langs = metadata['detected_languages'] if isinstance(metadata['detected_languages'], list) else []
+
+            if not cumulative_languages.issuperset(new_langs):
+                cumulative_languages.update(new_langs)
+                cumulative_sorted = sorted(cumulative_languages)
+
+            timeline.append({
+                'id': alert['id'],
+                'date': alert['created_at'],
+                'signal_type': signal_type,
+                'title': alert['title'],
+                'message': alert['message'],
+                'url': alert['url'],
+                'author': metadata.get('author'),
+                'files': metadata.get('files', []),
+                'languages_added': new_langs,
+                'cumulative_languages': cumulative_sorted,
+                'pr_number': metadata.get('pr_number'),
+                'reviewers': metadata.get('reviewers', [])
+            })
 
     return timeline
 
 
+@_ttl_cache
 def get_all_companies_summary() -> List[Dict]:
     """Get summary of all companies with GitHub i18n activity."""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-
-    cur.execute("""
-        SELECT
-            company,
-            COUNT(*) as total_signals,
-            COUNT(CASE WHEN metadata->>'signal_type' = 'NEW_LANG_FILE' THEN 1 END) as lang_files,
-            COUNT(CASE WHEN metadata->>'signal_type' = 'OPEN_PR' THEN 1 END) as open_prs,
-            MIN(created_at) as first_activity,
-            MAX(created_at) as last_activity
-        FROM alerts
-        WHERE source = 'github'
-        GROUP BY company
-        ORDER BY last_activity DESC
-    """)
-
-    companies = [dict(row) for row in cur.fetchall()]
-    cur.close()
-    conn.close()
+    with get_cursor(readonly=True) as cur:
+        cur.execute("""
+            SELECT
+                company,
+                COUNT(*) as total_signals,
+                COUNT(*) FILTER (WHERE metadata->>'signal_type' = 'NEW_LANG_FILE') as lang_files,
+                COUNT(*) FILTER (WHERE metadata->>'signal_type' = 'OPEN_PR') as open_prs,
+                MIN(created_at) as first_activity,
+                MAX(created_at) as last_activity
+            FROM alerts
+            WHERE source = 'github'
+            GROUP BY company
+            ORDER BY last_activity DESC
+        """)
+
+        companies = _fetch_dicts(cur)
 
     return companies
 
 
+# One pass over the author's alerts; languages are unnested per row,
+# so row counts use DISTINCT ids.
+_CONTRIBUTOR_QUERY = """
+    SELECT
+        a.metadata->>'author' as username,
+        a.company,
+        COUNT(DISTINCT a.id) as commit_count,
+        COUNT(DISTINCT a.id) FILTER (WHERE a.metadata->>'signal_type' = 'NEW_LANG_FILE') as lang_file_commits,
+        COUNT(DISTINCT a.id) FILTER (WHERE a.metadata->>'signal_type' = 'OPEN_PR') as pr_count,
+        MIN(a.created_at) as first_seen,
+        MAX(a.created_at) as last_active,
+        ARRAY_AGG(DISTINCT a.metadata->>'signal_type') FILTER (WHERE a.metadata->>'signal_type' IS NOT NULL) as signal_types,
+        COALESCE(ARRAY_AGG(DISTINCT l.lang) FILTER (WHERE l.lang IS NOT NULL), ARRAY[]::text[]) as languages
+    FROM alerts a
+    LEFT JOIN LATERAL jsonb_array_elements_text(
+        COALESCE(a.metadata->'new_langs', a.metadata->'detected_languages', '[]'::jsonb)
+    ) l(lang) ON true
+    WHERE a.source = 'github'
+        AND a.metadata->>'author' IS NOT NULL
+        AND a.metadata->>'author' != ''
+        {company_filter}
+    GROUP BY a.metadata->>'author', a.company
+    ORDER BY {order_by}
+    LIMIT %s
+"""
+
+# ORDER BY clauses for get_all_contributors' sort_by values.
+CONTRIBUTOR_SORT_COLUMNS = {
+    'commits': "commit_count {dir}",
+    'company': "company {dir}, commit_count DESC",
+    'last_active': "last_active {dir}",
+    'languages': "COUNT(DISTINCT l.lang) {dir}",
+}
+
+# Every (sort_by, direction, company-filtered) variant, built once so each
+# request executes one of a fixed set of query strings.
+_CONTRIBUTOR_QUERIES = {
+    (sort_by, order_dir, filtered): _CONTRIBUTOR_QUERY.format(
+        company_filter="AND a.company = %s" if filtered else "",
+        order_by=order_by.format(dir=order_dir),
+    )
+    for sort_by, order_by in CONTRIBUTOR_SORT_COLUMNS.items()
+    for order_dir in ("ASC", "DESC")
+    for filtered in (False, True)
+}
+
+
 def get_all_contributors(company: Optional[str] = None, sort_by: str = 'commits',
                          sort_order: str = 'desc', limit: int = 100) -> List[Dict]:
     """
@@ -351,187 +525,101 @@ def get_all_contributors(company: Optional[str] = None, sort_by: str = 'commits'
     Returns:
         List of contributor dicts with aggregated stats
     """
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-
-    # Build query to aggregate contributor data
-    query = """
-        WITH contributor_data AS (
-            SELECT
-                metadata->>'author' as username,
-                company,
-                COUNT(*) as commit_count,
-                COUNT(CASE WHEN metadata->>'signal_type' = 'NEW_LANG_FILE' THEN 1 END) as lang_file_commits,
-                COUNT(CASE WHEN metadata->>'signal_type' = 'OPEN_PR' THEN 1 END) as pr_count,
-                MIN(created_at) as first_seen,
-                MAX(created_at) as last_active,
-                ARRAY_AGG(DISTINCT metadata->>'signal_type') FILTER (WHERE metadata->>'signal_type' IS NOT NULL) as signal_types
-            FROM alerts
-            WHERE source = 'github'
-                AND metadata->>'author' IS NOT NULL
-                AND metadata->>'author' != ''
-    """
-
-    params = []
-    if company:
-        query += " AND company = %s"
-        params.append(company)
-
-    query += """
-            GROUP BY metadata->>'author', company
-        ),
-        contributor_languages AS (
-            SELECT
-                metadata->>'author' as username,
-                company,
-                ARRAY_AGG(DISTINCT lang) FILTER (WHERE lang IS NOT NULL) as languages
-            FROM alerts,
-                LATERAL (
-                    SELECT jsonb_array_elements_text(
-                        COALESCE(metadata->'new_langs', metadata->'detected_languages', '[]'::jsonb)
-                    ) as lang
-                ) langs
-            WHERE source = 'github'
-                AND metadata->>'author' IS NOT NULL
-    """
-
-    if company:
-        query += " AND company = %s"
-        params.append(company)
-
-    query += """
-            GROUP BY metadata->>'author', company
-        )
-        SELECT
-            cd.username,
-            cd.company,
-            cd.commit_count,
-            cd.lang_file_commits,
-            cd.pr_count,
-            cd.first_seen,
-            cd.last_active,
-            cd.signal_types,
-            COALESCE(cl.languages, ARRAY[]::text[]) as languages
-        FROM contributor_data cd
-        LEFT JOIN contributor_languages cl
-            ON cd.username = cl.username AND cd.company = cl.company
-    """
-
-    # Add sorting
+    if sort_by not in CONTRIBUTOR_SORT_COLUMNS:
+        sort_by = 'commits'
     order_dir = "DESC" if sort_order.lower() == 'desc' else "ASC"
-    if sort_by == 'commits':
-        query += f" ORDER BY cd.commit_count {order_dir}"
-    elif sort_by == 'company':
-        query += f" ORDER BY cd.company {order_dir}, cd.commit_count DESC"
-    elif sort_by == 'last_active':
-        query += f" ORDER BY cd.last_active {order_dir}"
-    elif sort_by == 'languages':
-        query += f" ORDER BY COALESCE(array_length(cl.languages, 1), 0) {order_dir}"
-    else:
-        query += f" ORDER BY cd.commit_count {order_dir}"
-
-    query += " LIMIT %s"
-    params.append(limit)
-
-    cur.execute(query, params)
-    contributors = [dict(row) for row in cur.fetchall()]
+    query = _CONTRIBUTOR_QUERIES[(sort_by, order_dir, bool(company))]
+    params = [company, limit] if company else [limit]
 
-    cur.close()
-    conn.close()
+    # Large exports stream through a server-side cursor.
+    cursor_name = 'all_contributors' if limit > SERVER_CURSOR_ITERSIZE else None
+    with get_cursor(dict_cursor=True, name=cursor_name) as cur:
+        cur.execute(query, params)
+        contributors = list(cur)  # RealDictRow is already a dict
 
     return contributors
 
 
+@_ttl_cache
 def get_contributor_stats() -> Dict:
     """Get overall contributor statistics."""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-
-    cur.execute("""
-        SELECT
-            COUNT(DISTINCT metadata->>'author') as total_contributors,
-            COUNT(DISTINCT company) as total_companies,
-            COUNT(*) as total_commits
-        FROM alerts
-        WHERE source = 'github'
-            AND metadata->>'author' IS NOT NULL
-            AND metadata->>'author' != ''
-    """)
-
-    result = cur.fetchone()
-    stats = dict(result) if result else {
-        'total_contributors': 0,
-        'total_companies': 0,
-        'total_commits': 0
-    }
+    with get_cursor(dict_cursor=True, readonly=True) as cur:
+        cur.execute("""
+            SELECT
+                COUNT(DISTINCT metadata->>'author') as total_contributors,
+                COUNT(DISTINCT company) as total_companies,
+                COUNT(*) as total_commits
+            FROM alerts
+            WHERE source = 'github'
+                AND metadata->>'author' IS NOT NULL
+                AND metadata->>'author' != ''
+        """)
 
-    cur.close()
-    conn.close()
+        result = cur.fetchone()
+        stats = dict(result) if result else {
+            'total_contributors': 0,
+            'total_companies': 0,
+            'total_commits': 0
+        }
 
     return stats
 
 
 def get_contributor_details(username: str) -> Dict:
     """Get detailed information about a specific contributor."""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-
-    # Get all alerts for this contributor
-    cur.execute("""
-        SELECT
-            company,
-            title,
-            message,
-            url,
-            created_at,
-            metadata
-        FROM alerts
-        WHERE source = 'github'
-            AND metadata->>'author' = %s
-        ORDER BY created_at DESC
-        LIMIT 50
-    """, (username,))
-
-    alerts = [dict(row) for row in cur.fetchall()]
-
-    # Aggregate by company
-    companies = {}
-    all_languages = set()
-
-    for alert in alerts:
-        company = alert['company']
-        if company not in companies:
-            companies[company] = {
-                'commit_count': 0,
-                'languages': set(),
-                'last_active': None
+    with get_cursor(readonly=True) as cur:
+        # Per-company totals over all of the author's alerts; languages from
+        # both new_langs and detected_languages are unnested per row.
+        cur.execute("""
+            SELECT
+                a.company,
+                COUNT(DISTINCT a.id) as commit_count,
+                MAX(a.created_at) as last_active,
+                COALESCE(ARRAY_AGG(DISTINCT l.lang ORDER BY l.lang) FILTER (WHERE l.lang IS NOT NULL), ARRAY[]::text[]) as languages
+            FROM alerts a
+            LEFT JOIN LATERAL (
+                SELECT jsonb_array_elements_text(v.langs) as lang
+                FROM (VALUES (a.metadata->'new_langs'), (a.metadata->'detected_languages')) v(langs)
+                WHERE jsonb_typeof(v.langs) = 'array'
+            ) l ON true
+            WHERE a.source = 'github'
+                AND a.metadata->>'author' = %s
+            GROUP BY a.company
+        """, (username,))
+        companies = {
+            row['company']: {
+                'commit_count': row['commit_count'],
+                'languages': row['languages'],
+                'last_active': row['last_active']
             }
-        companies[company]['commit_count'] += 1
-        if not companies[company]['last_active'] or alert['created_at'] > companies[company]['last_active']:
-            companies[company]['last_active'] = alert['created_at']
-
-        metadata = alert.get('metadata') or {}
-        if metadata.get('new_langs'):
-            langs = metadata['new_langs'] if isinstance(metadata['new_langs'], list) else []
-            companies[company]['languages'].update(langs)
-            all_languages.update(langs)
-        if metadata.get('detected_languages'):
-            langs = metadata['detected_languages'] if isinstance(metadata['detected_languages'], list) else []
-            companies[company]['languages'].update(langs)
-            all_languages.update(langs)
-
-    # Convert sets to lists
-    for company in companies:
-        companies[company]['languages'] = sorted(list(companies[company]['languages']))
-
-    cur.close()
-    conn.close()
+            for row in _fetch_dicts(cur)
+        }
+
+        cur.execute("""
+            SELECT
+                company,
+                title,
+                message,
+                url,
+                created_at,
+                metadata
+            FROM alerts
+            WHERE source = 'github'
+                AND metadata->>'author' = %s
+            ORDER BY created_at DESC
+            LIMIT 10
+        """, (username,))
+        recent_alerts = _fetch_dicts(cur)
+
+    all_languages = set()
+    for data in companies.values():
+        all_languages.update(data['languages'])
 
     return {
         'username': username,
         'companies': companies,
-        'total_commits': len(alerts),
+        'total_commits': sum(data['commit_count'] for data in companies.values()),
         'total_companies': len(companies),
-        'all_languages': sorted(list(all_languages)),
-        'recent_alerts': alerts[:10]
+        'all_languages': sorted(all_languages),
+        'recent_alerts': recent_alerts
     }
@@ -35,3 +35,165 @@ def test_sanitize_filename():
     """Test filename sanitization."""
     assert common.sanitize_filename("hello/world.json") == "hello_world_json"
     assert common.sanitize_filename("cool-file_name.txt") == "cool-file_name_txt"
+
+def test_run_parallel_preserves_order():
+    """Test parallel results come back in input order."""
+    assert common.run_parallel(lambda x: x * 2, [3, 1, 2], max_workers=3) == [6, 2, 4]
+    assert common.run_parallel(lambda x: x, [], max_workers=3) == []
+
+def test_alert_buffer_flushes_in_one_batch(mocker):
+    """Test buffered alerts are written with a single bulk call."""
+    mocker.patch.object(common, 'DB_AVAILABLE', True)
+    bulk = mocker.patch.object(common.storage, 'save_alerts_bulk', return_value=2)
+    buffer = common.AlertBuffer()
+    buffer.add("github", "A", "t1", "m1", ["i18n"], "u1")
+    buffer.add("github", "B", "t2", "m2", [], "u2", {"signal_type": "KEYWORD"})
+
+    assert buffer.flush() == 2
+    assert bulk.call_count == 1
+    assert [row["company"] for row in bulk.call_args.args[0]] == ["A", "B"]
+    assert buffer.flush() == 0
+
+def test_alert_buffer_flushes_when_full(mocker):
+    """Test a buffer reaching max_rows is written without waiting for flush()."""
+    mocker.patch.object(common, 'DB_AVAILABLE', True)
+    bulk = mocker.patch.object(common.storage, 'save_alerts_bulk', return_value=2)
+    buffer = common.AlertBuffer(max_rows=2)
+    buffer.add("github", "A", "t1", "m1", [], "u1")
+    bulk.assert_not_called()
+    buffer.add("github", "B", "t2", "m2", [], "u2")
+
+    assert bulk.call_count == 1
+    assert len(bulk.call_args.args[0]) == 2
+
+def test_contains_keywords_overlapping():
+    """Test keywords that overlap each other are all reported, in list order."""
+    keywords = ["i18n", "i18next", "next", "translation", "translations"]
+    assert common.contains_keywords("Add I18NEXT translations", keywords) == keywords
+    assert common.contains_keywords("nothing", keywords) == []
+
+def test_next_slack_batch_collects_pending_alerts():
+    """Test alerts queued together are sent as one batch."""
+    for i in range(3):
+        common._slack_queue.put_nowait(f"alert {i}")
+
+    batch = common._next_slack_batch()
+    for _ in batch:
+        common._slack_queue.task_done()
+    assert batch == ["alert 0", "alert 1", "alert 2"]
+
+def test_github_get_serves_304_from_cache(mocker, tmp_path):
+    """Test a 304 returns the body cached from the previous 200."""
+    mocker.patch('config.STATE_DB_FILE', str(tmp_path / "state.db"))
+    mocker.patch.object(common, 'get_headers', return_value={})
+    ok = mocker.Mock(status_code=200, headers={"ETag": '"v1"', "X-RateLimit-Remaining": "4999"})
+    ok.json.return_value = {"items": [1]}
+    ok.content = b'{"items": [1]}'
+    not_modified = mocker.Mock(status_code=304, headers={"X-RateLimit-Remaining": "4999"})
+    get = mocker.patch.object(common.http_session, 'get', side_effect=[ok, not_modified])
+
+    assert common.github_get("https://api.github.com/search", {"q": "i18n"}) == (200, {"items": [1]})
+    assert common.github_get("https://api.github.com/search", {"q": "i18n"}) == (200, {"items": [1]})
+    assert get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+def test_save_json_round_trip(tmp_path):
+    """Test JSON state is written atomically and reads back unchanged."""
+    path = str(tmp_path / "state.json")
+    common.save_json(path, {"org/repo": {"sha": "abc"}, "langs": ["fr", "ja"]})
+
+    assert common.load_json(path) == {"org/repo": {"sha": "abc"}, "langs": ["fr", "ja"]}
+    assert not (tmp_path / "state.json.tmp").exists()
+
+def test_check_rate_limit_waits_only_when_budget_low(mocker):
+    """Test requests only stall once the remaining budget drops below the floor."""
+    mocker.patch.object(common.time, 'time', return_value=1000)
+    sleep = mocker.patch.object(common.time, 'sleep')
+    headers = {"X-RateLimit-Limit": "5000", "X-RateLimit-Reset": "1030"}
+
+    common.check_rate_limit(mocker.Mock(headers={**headers, "X-RateLimit-Remaining": "4000"}))
+    sleep.assert_not_called()
+
+    common.check_rate_limit(mocker.Mock(headers={**headers, "X-RateLimit-Remaining": "50"}))
+    sleep.assert_called_once_with(30)
+
+def test_github_connector_token_reused_until_expiry(mocker, monkeypatch):
+    """Test the connector token is fetched once and reused while unexpired."""
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setenv("REPLIT_CONNECTORS_HOSTNAME", "connectors.example")
+    monkeypatch.setenv("REPL_IDENTITY", "identity")
+    mocker.patch.dict(common._github_connection_cache, {"token": None, "deadline": 0.0})
+    response = mocker.Mock()
+    response.json.return_value = {"items": [{"settings": {
+        "access_token": "tok", "expires_at": "2999-01-01T00:00:00Z"
+    }}]}
+    get = mocker.patch.object(common.http_session, 'get', return_value=response)
+
+    assert common.get_github_access_token() == "tok"
+    assert common.get_github_access_token() == "tok"
+    assert get.call_count == 1
+
+def test_github_connector_token_without_expiry_is_reused(mocker, monkeypatch):
+    """Test a connector token with no expires_at is still cached for the default lifetime."""
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setenv("REPLIT_CONNECTORS_HOSTNAME", "connectors.example")
+    monkeypatch.setenv("REPL_IDENTITY", "identity")
+    mocker.patch.dict(common._github_connection_cache, {"token": None, "deadline": 0.0})
+    response = mocker.Mock()
+    response.json.return_value = {"items": [{"settings": {"access_token": "tok"}}]}
+    get = mocker.patch.object(common.http_session, 'get', return_value=response)
+
+    assert common.get_github_access_token() == "tok"
+    assert common.get_github_access_token() == "tok"
+    assert get.call_count == 1
+
+def test_github_get_fresh_response_skips_request(mocker, tmp_path):
+    """Test a response within its Cache-Control max-age is served without a request."""
+    mocker.patch('config.STATE_DB_FILE', str(tmp_path / "state.db"))
+    mocker.patch.object(common, 'get_headers', return_value={})
+    ok = mocker.Mock(status_code=200, headers={"ETag": '"v1"', "Cache-Control": "private, max-age=60"})
+    ok.content = b'{"items": [1]}'
+    get = mocker.patch.object(common.http_session, 'get', return_value=ok)
+
+    assert common.github_get("https://api.github.com/repos/o/r") == (200, {"items": [1]})
+    assert common.github_get("https://api.github.com/repos/o/r") == (200, {"items": [1]})
+    assert get.call_count == 1
+
+def test_run_parallel_reuses_named_pool():
+    """Test a named pool is created once and reused across calls."""
+    assert common.run_parallel(lambda x: x + 1, [1, 2], max_workers=2, pool="test") == [2, 3]
+    pool = common.get_pool("test", 2)
+    assert common.run_parallel(lambda x: x, [5], max_workers=2, pool="test") == [5]
+    assert common.get_pool("test", 2) is pool
+
+
+def test_github_fetch_honours_retry_after(mocker):
+    """A secondary rate limit's Retry-After is waited out before retrying."""
+    import requests
+    limited = requests.Response()
+    limited.status_code = 403
+    limited.headers["Retry-After"] = "7"
+    ok = requests.Response()
+    ok.status_code = 200
+    get = mocker.patch.object(common.http_session, 'get', side_effect=[limited, ok])
+    sleep = mocker.patch.object(common.time, 'sleep')
+
+    assert common.github_fetch("https://api.github.com/x") is ok
+    assert get.call_count == 2
+    sleep.assert_called_once_with(7.0)
+
+
+def test_github_cache_skips_search_and_prunes_stale(mocker, tmp_path):
+    """Search responses are not cached; stale cached entries are pruned."""
+    mocker.patch('config.STATE_DB_FILE', str(tmp_path / "state.db"))
+    mocker.patch.object(common, 'get_headers', return_value={})
+    ok = mocker.Mock(status_code=200, headers={"ETag": '"v1"'})
+    ok.content = b'{"items": []}'
+    mocker.patch.object(common.http_session, 'get', return_value=ok)
+
+    common.github_get("https://api.github.com/search/repositories", {"q": "i18n"})
+    common.github_get("https://api.github.com/orgs/acme")
+    assert common.state_get("github_etags", "https://api.github.com/search/repositories?q=i18n") is None
+    assert common.state_get("github_etags", "https://api.github.com/orgs/acme")["etag"] == '"v1"'
+
+    assert common.prune_github_cache(max_age=-1) == 1
+    assert common.state_get("github_etags", "https://api.github.com/orgs/acme") is None
@@ -0,0 +1,44 @@
+from monitors import discovery
+
+
+def test_search_recent_i18n_prs_uses_one_graphql_request(mocker):
+    """All firehose queries go out as one aliased GraphQL search."""
+    node = {
+        "databaseId": 7, "title": "Add French translation", "url": "https://github.com/acme/app/pull/7",
+        "createdAt": "2024-01-01T00:00:00Z", "state": "OPEN",
+        "author": {"login": "alice"}, "repository": {"nameWithOwner": "acme/app"},
+    }
+    graphql = mocker.patch.object(discovery, 'github_graphql', return_value={"q0": {"nodes": [node]}, "q1": {"nodes": [node]}})
+    rest = mocker.patch.object(discovery, '_search_prs')
+
+    prs = discovery.search_recent_i18n_prs()
+
+    assert graphql.call_count == 1
+    rest.assert_not_called()
+    assert prs == [{
+        'title': "Add French translation", 'url': "https://github.com/acme/app/pull/7",
+        'owner': "acme", 'repo': "app", 'full_name': "acme/app", 'author': "alice",
+        'created_at': "2024-01-01T00:00:00Z", 'state': "open", 'source': 'pr_firehose'
+    }]
+
+
+def test_exclude_orgs_from_query_respects_length_limit():
+    """Followed orgs are excluded in the query only as far as the length limit allows."""
+    assert discovery.exclude_orgs_from_query("i18n", ["acme", "globex"]) == "i18n -user:acme -user:globex"
+
+    query = discovery.exclude_orgs_from_query("i18n", [f"org{i}" for i in range(100)])
+    assert len(query) <= discovery.GITHUB_SEARCH_QUERY_MAX
+    assert query.startswith("i18n -user:org0 -user:org1")
+
+
+def test_company_industry_retries_after_org_fetch_failure(mocker):
+    """A failed org fetch is not cached; the next call fetches again."""
+    discovery.fetch_org.cache_clear()
+    get = mocker.patch.object(discovery, 'github_get', side_effect=[
+        (403, None), (200, {"description": "Online payments platform"})
+    ])
+
+    assert discovery.get_company_industry("Zyxwv", "zyxwv-org") is None
+    assert discovery.get_company_industry("Zyxwv", "zyxwv-org") == "fintech"
+    assert get.call_count == 2
+    discovery.fetch_org.cache_clear()
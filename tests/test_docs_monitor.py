@@ -0,0 +1,94 @@
+from monitors import docs_monitor, state
+
+
+def test_fetch_doc_html_conditional(mocker):
+    """Stored validators are sent and a 304 yields no HTML."""
+    response = mocker.Mock(status_code=304)
+    get = mocker.patch.object(docs_monitor.http_session, 'get', return_value=response)
+    validators = {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    assert docs_monitor.fetch_doc_html("https://example.com/docs", validators) is None
+    headers = get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert validators["etag"] == '"v1"'
+
+
+def test_check_doc_url_legacy_md5_hash_is_unchanged(mocker):
+    """An MD5 hash stored by older versions does not register as a change."""
+    import hashlib
+    alert = mocker.patch.object(docs_monitor, 'alert')
+    text = "Docs about i18n"
+    url = "https://example.com/docs"
+    url_key = docs_monitor.get_url_key(url)
+    doc_hashes = {url_key: hashlib.md5(text.encode()).hexdigest()}
+    page = (text, docs_monitor.hash_text(text), set())
+
+    assert docs_monitor.check_doc_url("A", url, doc_hashes, {}, page=page) == 0
+    alert.assert_not_called()
+    assert doc_hashes[url_key] == docs_monitor.hash_text(text)
+
+
+def test_previous_text_round_trip(mocker, tmp_path):
+    """Previous text is stored compressed and read back unchanged."""
+    mocker.patch('config.STATE_DB_FILE', str(tmp_path / "state.db"))
+    mocker.patch('config.PREVIOUS_TEXTS_DIR', str(tmp_path / "previous_texts"))
+    state.state_set_bytes("previous_texts", "k", docs_monitor.zlib.compress("héllo i18n".encode('utf-8')))
+
+    assert docs_monitor.load_previous_text("k") == "héllo i18n"
+    assert docs_monitor.load_previous_text("missing") == ""
+
+
+def test_check_doc_url_unchanged_page_writes_nothing(mocker):
+    """A page whose hash is unchanged leaves state untouched."""
+    from monitors.state import StateDict
+    write_text = mocker.patch.object(docs_monitor, 'state_set_many')
+    text = "Docs about i18n"
+    url = "https://example.com/docs"
+    url_key = docs_monitor.get_url_key(url)
+    doc_hashes = StateDict("doc_hashes", {url_key: docs_monitor.hash_text(text)})
+    prev_hreflangs = StateDict("doc_hreflangs", {url_key: ["fr"]})
+    page = (text, docs_monitor.hash_text(text), {"fr"})
+
+    assert docs_monitor.check_doc_url("A", url, doc_hashes, prev_hreflangs, page=page) == 0
+    write_text.assert_not_called()
+    assert not doc_hashes.dirty and not prev_hreflangs.dirty
+
+
+def test_html_parser_fallback_extracts_text_and_hreflangs():
+    """The streaming parser skips scripts/styles and reads alternate hreflangs."""
+    html = (
+        '<html><head><link rel="alternate" hreflang="FR" href="/fr">'
+        '<link rel="canonical" hreflang="es" href="/"><style>p {}</style></head>'
+        '<body><p>Docs &amp; API</p><script>var hidden;</script></body></html>'
+    )
+
+    assert docs_monitor._parse_with_html_parser(html) == ("Docs & API", {"fr"})
+
+
+def test_fetch_doc_html_caps_body_size(mocker):
+    """Bodies beyond DOC_MAX_BYTES are truncated while streaming."""
+    import io
+    import requests
+    mocker.patch('config.DOC_MAX_BYTES', 10)
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = 'utf-8'
+    response.raw = io.BytesIO(b"<p>" + b"x" * 100 + b"</p>")
+    mocker.patch.object(docs_monitor.http_session, 'get', return_value=response)
+
+    assert docs_monitor.fetch_doc_html("https://example.com/docs") == "<p>xxxxxxx"
+
+
+def test_fetch_doc_pages_replaces_broken_parse_pool(mocker):
+    """A crashed parse pool is discarded and the pages are parsed in-process."""
+    broken = mocker.Mock()
+    broken.map.side_effect = docs_monitor.BrokenProcessPool("worker died")
+    mocker.patch.object(docs_monitor, '_PARSE_POOL', broken)
+    mocker.patch.object(docs_monitor, 'fetch_doc_html', return_value='<html><body><p>Hello</p></body></html>')
+
+    text, content_hash, _ = docs_monitor.fetch_doc_pages(["https://example.com/docs"])[0]
+
+    assert "Hello" in text and content_hash
+    assert docs_monitor._PARSE_POOL is None
+    broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
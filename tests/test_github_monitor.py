@@ -0,0 +1,175 @@
+import json
+import requests
+from monitors import common, github_monitor
+
+
+def json_response(payload, status_code=200, headers=None):
+    """Build a real requests.Response carrying a JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def test_get_repo_state_legacy_sha():
+    """Older state files stored the last SHA as a plain string."""
+    assert github_monitor.get_repo_state({"A/org/repo": "abc"}, "A/org/repo") == {"sha": "abc"}
+    assert github_monitor.get_repo_state({}, "A/org/repo") == {}
+
+
+def test_check_github_repo_not_modified(mocker):
+    """A 304 on the commit list short-circuits without touching state."""
+    mocker.patch.object(github_monitor, 'get_headers', return_value={})
+    response = mocker.Mock(status_code=304)
+    get = mocker.patch.object(common.http_session, 'get', return_value=response)
+    last_commits = {"A/org/repo": {"sha": "abc", "etag": '"etag-1"'}}
+
+    assert github_monitor.check_github_repo("A", "org", "repo", last_commits) == 0
+    assert get.call_args.kwargs["headers"]["If-None-Match"] == '"etag-1"'
+    assert last_commits == {"A/org/repo": {"sha": "abc", "etag": '"etag-1"'}}
+
+
+def test_get_prs_reviewers_batches_graphql(mocker):
+    """Reviewers for all PRs come from one aliased GraphQL query."""
+    graphql = mocker.patch.object(github_monitor, 'github_graphql', return_value={
+        "repository": {
+            "pr1": {"reviewRequests": {"nodes": [{"requestedReviewer": {"login": "alice"}}]}},
+            "pr2": {"reviewRequests": {"nodes": [{"requestedReviewer": {}}]}},
+        }
+    })
+    rest = mocker.patch.object(github_monitor, 'get_pr_reviewers')
+
+    reviewers = github_monitor.get_prs_reviewers("org", "repo", [1, 2])
+
+    assert reviewers == {1: ["alice"], 2: []}
+    assert graphql.call_count == 1
+    rest.assert_not_called()
+
+
+def test_check_github_repo_since_paginates(mocker):
+    """Known repos request commits since the last seen date and follow Link pages."""
+    mocker.patch.object(github_monitor, 'get_headers', return_value={})
+    mocker.patch.object(github_monitor, 'get_commit_files', return_value=[])
+    first = json_response(
+        [{"sha": "new", "commit": {"committer": {"date": "2024-02-01T00:00:00Z"}}}],
+        headers={"ETag": '"e2"', "Link": '<https://api.github.com/page2>; rel="next"'}
+    )
+    second = json_response([{"sha": "abc"}])
+    get = mocker.patch.object(common.http_session, 'get', side_effect=[first, second])
+    last_commits = {"A/org/repo": {"sha": "abc", "date": "2024-01-01T00:00:00Z"}}
+
+    github_monitor.check_github_repo("A", "org", "repo", last_commits)
+
+    assert get.call_args_list[0].kwargs["params"]["since"] == "2024-01-01T00:00:00Z"
+    assert get.call_args_list[1].args[0] == "https://api.github.com/page2"
+    assert last_commits["A/org/repo"] == {"sha": "new", "date": "2024-02-01T00:00:00Z", "etag": '"e2"'}
+
+
+def test_check_github_repo_cold_start_fetches_one_small_page(mocker):
+    """A repo without stored state only looks at the newest 20 commits."""
+    mocker.patch.object(github_monitor, 'get_headers', return_value={})
+    mocker.patch.object(github_monitor, 'get_commit_files', return_value=[])
+    get = mocker.patch.object(common.http_session, 'get', return_value=json_response(
+        [{"sha": "c1"}], headers={"Link": '<https://api.github.com/page2>; rel="next"'}
+    ))
+
+    github_monitor.check_github_repo("A", "org", "repo", {})
+
+    assert get.call_count == 1
+    assert get.call_args.kwargs["params"] == {"per_page": 20}
+
+
+def test_check_github_repo_skips_files_for_covered_merges(mocker):
+    """Merge commits whose merged parent is in the batch don't fetch files."""
+    mocker.patch.object(github_monitor, 'get_headers', return_value={})
+    get_files = mocker.patch.object(github_monitor, 'get_commit_files', return_value=[])
+    response = json_response([
+        {"sha": "merge", "parents": [{"sha": "base"}, {"sha": "feature"}]},
+        {"sha": "feature", "parents": [{"sha": "base"}]},
+        {"sha": "base", "parents": []},
+    ])
+    mocker.patch.object(common.http_session, 'get', return_value=response)
+
+    github_monitor.check_github_repo("A", "org", "repo", {"A/org/repo": {"sha": "base"}})
+
+    assert [c.args[2] for c in get_files.call_args_list] == ["feature"]
+
+
+def test_check_github_repo_compare_skips_commit_files(mocker):
+    """When the compare range adds no localization files, no per-commit calls are made."""
+    mocker.patch.object(github_monitor, 'get_headers', return_value={})
+    get_files = mocker.patch.object(github_monitor, 'get_commit_files', return_value=[])
+    compare = mocker.patch.object(github_monitor, 'get_compare_files', return_value=[
+        {"filename": "src/app.py", "status": "added"}
+    ])
+    response = json_response([{"sha": "c2"}, {"sha": "c1"}, {"sha": "base"}])
+    mocker.patch.object(common.http_session, 'get', return_value=response)
+
+    github_monitor.check_github_repo("A", "org", "repo", {"A/org/repo": {"sha": "base"}})
+
+    compare.assert_called_once_with("org", "repo", "base", "c2")
+    get_files.assert_not_called()
+
+
+def test_check_github_repo_caps_commit_file_fetches(mocker):
+    """Only the newest GITHUB_MAX_COMMIT_DETAILS commits get per-commit file lookups."""
+    mocker.patch('config.GITHUB_MAX_COMMIT_DETAILS', 2)
+    mocker.patch.object(github_monitor, 'get_headers', return_value={})
+    mocker.patch.object(github_monitor, 'get_compare_files', return_value=None)
+    get_files = mocker.patch.object(github_monitor, 'get_commit_files', return_value=[])
+    response = json_response([{"sha": "c3"}, {"sha": "c2"}, {"sha": "c1"}, {"sha": "base"}])
+    mocker.patch.object(common.http_session, 'get', return_value=response)
+
+    github_monitor.check_github_repo("A", "org", "repo", {"A/org/repo": {"sha": "base"}})
+
+    assert sorted(c.args[2] for c in get_files.call_args_list) == ["c2", "c3"]
+
+
+def test_check_github_prs_not_modified(mocker):
+    """The PR list is requested conditionally and a 304 produces no alerts."""
+    mocker.patch.object(github_monitor, 'get_headers', return_value={})
+    get = mocker.patch.object(common.http_session, 'get', return_value=mocker.Mock(status_code=304))
+    reviewers = mocker.patch.object(github_monitor, 'get_prs_reviewers')
+
+    assert github_monitor.check_github_prs("A", "org", "repo", {"A/org/repo": {"etag": '"p1"'}}) == 0
+    assert get.call_args.kwargs["headers"]["If-None-Match"] == '"p1"'
+    reviewers.assert_not_called()
+
+
+def test_check_all_github_persists_quiet_repos_immediately(mocker):
+    """A repo without alerts has its state written as soon as it is checked."""
+    from monitors.state import StateDict
+
+    def check_repo(company, org, repo, last_commits):
+        last_commits[f"{company}/{org}/{repo}"] = {"sha": "new"}
+        return 0
+    mocker.patch.object(github_monitor, 'load_state', side_effect=lambda ns, *a: StateDict(ns))
+    mocker.patch.object(github_monitor, 'save_state')
+    mocker.patch.object(github_monitor, 'check_github_repo', side_effect=check_repo)
+    mocker.patch.object(github_monitor, 'check_github_prs', return_value=0)
+    write = mocker.patch.object(github_monitor, 'state_set_many')
+
+    github_monitor.check_all_github([{"company": "A", "github_org": "org", "github_repos": ["repo"]}])
+
+    write.assert_called_once_with([("last_commits", "A/org/repo", {"sha": "new"})])
+
+
+def test_check_github_prs_skips_seen_unchanged_prs(mocker):
+    """Only PRs that are new or updated since the last check can alert."""
+    mocker.patch.object(github_monitor, 'get_headers', return_value={})
+    mocker.patch.object(github_monitor, 'alert')
+    mocker.patch.object(github_monitor.alert_buffer, 'add')
+    mocker.patch.object(github_monitor, 'get_prs_reviewers', return_value={})
+    response = json_response([
+        {"number": 1, "title": "Add French translation", "updated_at": "2024-01-01T00:00:00Z"},
+        {"number": 2, "title": "Add German translation", "updated_at": "2024-01-01T00:00:00Z"},
+        {"number": 3, "title": "Update Spanish i18n", "updated_at": "2024-01-03T00:00:00Z"},
+    ], headers={"ETag": '"p2"'})
+    mocker.patch.object(common.http_session, 'get', return_value=response)
+    pr_states = {"A/org/repo": {"etag": '"p1"', "seen": [1, 3], "latest_updated": "2024-01-02T00:00:00Z"}}
+
+    assert github_monitor.check_github_prs("A", "org", "repo", pr_states) == 2
+    assert pr_states["A/org/repo"] == {
+        "etag": '"p2"', "seen": [1, 2, 3], "latest_updated": "2024-01-03T00:00:00Z"
+    }
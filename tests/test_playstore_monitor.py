@@ -0,0 +1,41 @@
+import time
+import config
+from monitors import playstore_monitor
+
+
+def test_check_play_store_package_skips_known_languages(mocker):
+    """Languages already stored are not probed again."""
+    mocker.patch.object(playstore_monitor, 'GPLAY_AVAILABLE', True)
+    playstore_monitor.fetch_app_listing.cache_clear()
+    mocker.patch.object(playstore_monitor, 'gplay_app', create=True,
+                        return_value={"title": "App", "description": "An app"})
+    probe = mocker.patch.object(playstore_monitor, 'probe_play_store_languages', return_value={"de"})
+    mocker.patch.object(playstore_monitor, 'alert')
+    mocker.patch.object(playstore_monitor.alert_buffer, 'add')
+    stored_langs = {"com.example": ["en", "fr"]}
+
+    assert playstore_monitor.check_play_store_package("A", "com.example", stored_langs) == 1
+    probed = probe.call_args.args[1]
+    assert "en" not in probed and "fr" not in probed and "de" in probed
+    assert set(stored_langs["com.example"]["langs"]) == {"en", "fr", "de"}
+
+
+def test_check_play_store_package_skips_unchanged_release(mocker):
+    """An unchanged release is not re-probed until the re-probe interval passes."""
+    mocker.patch.object(playstore_monitor, 'GPLAY_AVAILABLE', True)
+    playstore_monitor.fetch_app_listing.cache_clear()
+    mocker.patch.object(playstore_monitor, 'gplay_app', create=True, return_value={
+        "title": "App", "description": "An app", "version": "2.1", "updated": 1700000000
+    })
+    probe = mocker.patch.object(playstore_monitor, 'probe_play_store_languages')
+    probe.return_value = set()
+    stored_langs = {"com.example": {
+        "langs": ["en", "fr"], "version": "2.1", "updated": 1700000000, "probed": time.time()
+    }}
+
+    assert playstore_monitor.check_play_store_package("A", "com.example", stored_langs) == 0
+    probe.assert_not_called()
+
+    stored_langs["com.example"]["probed"] -= config.PLAY_STORE_REPROBE_INTERVAL + 1
+    playstore_monitor.check_play_store_package("A", "com.example", stored_langs)
+    probe.assert_called_once()
@@ -0,0 +1,48 @@
+import json
+import pytest
+from monitors import state
+
+
+@pytest.fixture
+def state_db(mocker, tmp_path):
+    mocker.patch('config.STATE_DB_FILE', str(tmp_path / "state.db"))
+    return tmp_path
+
+
+def test_state_round_trip_writes_only_changes(state_db, mocker):
+    """Only keys changed since load are written back."""
+    data = state.load_state("last_commits")
+    data["org/a"] = {"sha": "1"}
+    data["org/b"] = {"sha": "2"}
+    state.save_state(data)
+
+    reloaded = state.load_state("last_commits")
+    assert reloaded == {"org/a": {"sha": "1"}, "org/b": {"sha": "2"}}
+
+    reloaded["org/a"] = {"sha": "1"}
+    reloaded["org/b"] = {"sha": "3"}
+    assert reloaded.dirty == {"org/b"}
+    state.save_state(reloaded)
+    assert state.state_get("last_commits", "org/b") == {"sha": "3"}
+
+
+def test_load_state_imports_legacy_json(state_db):
+    """An empty namespace is seeded from the legacy JSON file."""
+    legacy = state_db / "doc_hashes.json"
+    legacy.write_text(json.dumps({"abc": "hash"}))
+
+    data = state.load_state("doc_hashes", str(legacy))
+    assert data == {"abc": "hash"}
+    state.save_state(data)
+    assert state.load_state("doc_hashes") == {"abc": "hash"}
+
+
+def test_state_set_many_mixes_json_and_bytes(state_db):
+    """Batched rows keep bytes as BLOBs and JSON-encode everything else."""
+    state.state_set_many([
+        ("previous_texts", "k", b"\x78\x9c"),
+        ("doc_keywords", "k", {"keywords": ["i18n"]}),
+    ])
+
+    assert state.state_get_raw("previous_texts", "k") == b"\x78\x9c"
+    assert state.state_get("doc_keywords", "k") == {"keywords": ["i18n"]}
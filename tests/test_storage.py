@@ -0,0 +1,139 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from psycopg2.pool import ThreadedConnectionPool
+
+import storage
+
+
+def test_get_cursor_rolls_back_and_returns_connection(mocker):
+    """A failing block rolls back and the connection goes back to the pool."""
+    pool = mocker.Mock()
+    conn = pool.getconn.return_value
+    conn.closed = 0
+    mocker.patch.object(storage, '_get_pool', return_value=pool)
+
+    with pytest.raises(ValueError):
+        with storage.get_cursor() as cur:
+            raise ValueError("boom")
+
+    conn.rollback.assert_called_once()
+    conn.commit.assert_not_called()
+    cur.close.assert_called_once()
+    pool.putconn.assert_called_once_with(conn, close=False)
+
+
+def test_get_connection_waits_when_pool_is_exhausted(mocker):
+    """More concurrent checkouts than DB_POOL_MAX wait for a connection instead of failing."""
+    mocker.patch('psycopg2.pool.psycopg2.connect', side_effect=lambda *a, **k: mocker.Mock(closed=0))
+    mocker.patch.object(storage, '_get_pool', return_value=ThreadedConnectionPool(0, 2))
+    mocker.patch.object(storage, '_pool_slots', threading.BoundedSemaphore(2))
+
+    def borrow(_):
+        with storage.get_connection():
+            time.sleep(0.01)
+        return True
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        assert all(executor.map(borrow, range(6)))
+
+
+def test_prune_old_alerts_binds_days_as_integer(mocker):
+    """The retention window is bound as a parameter, not spliced into a literal."""
+    cur = mocker.MagicMock(rowcount=3)
+    mocker.patch.object(storage, 'get_cursor').return_value.__enter__.return_value = cur
+
+    assert storage.prune_old_alerts(30) == 3
+    sql, params = cur.execute.call_args.args
+    assert "make_interval(days => %s)" in sql and "'%s" not in sql
+    assert params == (30, storage.PRUNE_BATCH_SIZE)
+
+
+def test_prefix_tsquery_sanitizes_search_terms():
+    """Plain search text becomes an AND of prefix terms; punctuation opts out."""
+    assert storage._prefix_tsquery("Shop i18n") == "shop:* & i18n:*"
+    assert storage._prefix_tsquery("a|b & !c") is None
+    assert storage._prefix_tsquery("!!") is None
+
+
+def test_dotted_file_name_search_uses_substring_match(mocker):
+    """Searching a file name like ja.json falls back to ILIKE instead of the tsvector."""
+    cur = mocker.MagicMock()
+    cur.description = []
+    cur.fetchall.return_value = []
+    mocker.patch.object(storage, 'get_cursor').return_value.__enter__.return_value = cur
+
+    storage.get_alerts(search="ja.json")
+
+    query, params = cur.execute.call_args.args
+    assert "search_tsv" not in query and "title ILIKE %s" in query
+    assert params[:4] == ["%ja.json%"] * 4
+
+
+def test_company_timeline_cumulative_languages(mocker):
+    """Each event carries the sorted set of languages seen up to that point."""
+    cur = mocker.MagicMock()
+    cur.__iter__.return_value = iter([
+        {"id": 1, "created_at": 1, "title": "", "message": "", "url": "", "metadata": {"new_langs": ["fr"]}},
+        {"id": 2, "created_at": 2, "title": "", "message": "", "url": "", "metadata": {"signal_type": "KEYWORD"}},
+        {"id": 3, "created_at": 3, "title": "", "message": "", "url": "", "metadata": {"detected_languages": ["de", "fr"]}},
+    ])
+    mocker.patch.object(storage, 'get_cursor').return_value.__enter__.return_value = cur
+
+    timeline = storage.get_company_timeline("A")
+
+    assert [e["cumulative_languages"] for e in timeline] == [["fr"], ["fr"], ["de", "fr"]]
+
+
+def test_dashboard_aggregates_cached_for_ttl(mocker):
+    """Repeat calls within the TTL reuse the first query's result."""
+    cur = mocker.MagicMock()
+    cur.fetchone.return_value = {"total": 5, "github_count": 5}
+    get_cursor = mocker.patch.object(storage, 'get_cursor')
+    get_cursor.return_value.__enter__.return_value = cur
+    storage.get_alert_stats.cache_clear()
+
+    first = storage.get_alert_stats()
+    first["total"] = 0
+    assert storage.get_alert_stats() == {"total": 5, "github_count": 5}
+    assert cur.execute.call_count == 1
+    storage.get_alert_stats.cache_clear()
+
+
+def test_contributor_sort_falls_back_to_prebuilt_query(mocker):
+    """Unknown sort keys run the prebuilt commit-count query, never interpolated input."""
+    cur = mocker.MagicMock()
+    cur.__iter__.return_value = iter([])
+    mocker.patch.object(storage, 'get_cursor').return_value.__enter__.return_value = cur
+
+    storage.get_all_contributors(company="A", sort_by="1; DROP TABLE alerts", sort_order="asc")
+
+    query, params = cur.execute.call_args.args
+    assert query is storage._CONTRIBUTOR_QUERIES[('commits', 'ASC', True)]
+    assert params == ["A", 100]
+
+
+def test_fetch_dicts_zips_column_names(mocker):
+    """Plain cursor rows come back as dicts keyed by column name."""
+    cur = mocker.MagicMock()
+    cur.description = [mocker.Mock(), mocker.Mock()]
+    cur.description[0].name, cur.description[1].name = "id", "company"
+    cur.fetchall.return_value = [(1, "A"), (2, "B")]
+
+    assert storage._fetch_dicts(cur) == [{"id": 1, "company": "A"}, {"id": 2, "company": "B"}]
+
+
+
+def test_company_metrics_languages_ignore_pr_keywords(mocker):
+    """OPEN_PR keyword matches stored as detected_languages are not counted as languages."""
+    cur = mocker.MagicMock()
+    cur.fetchone.return_value = {"signal_types": None, "detected_languages": []}
+    mocker.patch.object(storage, 'get_cursor').return_value.__enter__.return_value = cur
+
+    storage.get_company_metrics("A")
+
+    query = " ".join(cur.execute.call_args.args[0].split())
+    assert ("CASE WHEN metadata->>'signal_type' IS DISTINCT FROM 'OPEN_PR' "
+            "THEN metadata->'detected_languages' END") in query
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from monitors import webhooks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_deliver_coalesces_events_per_webhook(mocker):
+    """Several matching alerts go to a batching webhook as one request."""
+    mocker.patch.dict(webhooks._recent_deliveries, clear=True)
+    mocker.patch.object(webhooks, 'get_webhooks', return_value=[
+        {"name": "all", "url": "https://example.com/all", "batch": True},
+        {"name": "langs", "url": "https://example.com/langs", "events": ["NEW_LANG_FILE"]},
+    ])
+    post = mocker.patch.object(webhooks, 'post_json', return_value=mocker.Mock(status_code=200))
+    events = [
+        ("NEW_LANG_FILE", webhooks._event_payload({"title": "a"}, "NEW_LANG_FILE")),
+        ("KEYWORD", webhooks._event_payload({"title": "b"}, "KEYWORD")),
+    ]
+
+    assert webhooks._deliver(events) == 2
+    sent = {c.args[0]: c.args[1] for c in post.call_args_list}
+    assert sent["https://example.com/all"]["batch"] is True
+    assert len(sent["https://example.com/all"]["events"]) == 2
+    assert sent["https://example.com/langs"]["event"] == "NEW_LANG_FILE"
+
+
+def test_deliver_sends_one_event_per_request_by_default(mocker):
+    """Webhooks that didn't opt into batching keep getting one event per POST."""
+    mocker.patch.dict(webhooks._recent_deliveries, clear=True)
+    mocker.patch.object(webhooks, 'get_webhooks', return_value=[{"name": "all", "url": "https://example.com/all"}])
+    post = mocker.patch.object(webhooks, 'post_json', return_value=mocker.Mock(status_code=200))
+    events = [
+        ("NEW_LANG_FILE", webhooks._event_payload({"title": "a"}, "NEW_LANG_FILE")),
+        ("KEYWORD", webhooks._event_payload({"title": "b"}, "KEYWORD")),
+    ]
+
+    assert webhooks._deliver(events) == 2
+    assert sorted(c.args[1]["event"] for c in post.call_args_list) == ["KEYWORD", "NEW_LANG_FILE"]
+
+
+def test_deliver_skips_recently_delivered_alerts(mocker):
+    """A queued alert already delivered to a webhook isn't posted to it again."""
+    mocker.patch.dict(webhooks._recent_deliveries, clear=True)
+    mocker.patch.object(webhooks, 'get_webhooks', return_value=[{"name": "all", "url": "https://example.com/all"}])
+    post = mocker.patch.object(webhooks, 'post_json', return_value=mocker.Mock(status_code=200))
+    event = ("KEYWORD", webhooks._event_payload({"title": "a", "url": "https://github.com/o/r/commit/1"}, "KEYWORD"))
+
+    assert webhooks._deliver([event], dedup=True) == 1
+    assert webhooks._deliver([event], dedup=True) == 0
+    assert post.call_count == 1
+
+
+def test_send_webhook_ignores_dedup_window(mocker):
+    """A direct send is posted even if the same alert went out recently."""
+    mocker.patch.dict(webhooks._recent_deliveries, clear=True)
+    mocker.patch.object(webhooks, 'get_webhooks', return_value=[{"name": "all", "url": "https://example.com/all"}])
+    post = mocker.patch.object(webhooks, 'post_json', return_value=mocker.Mock(status_code=200))
+
+    assert webhooks.send_webhook({"title": "a"}, "KEYWORD") == 1
+    assert webhooks.send_webhook({"title": "a"}, "KEYWORD") == 1
+    assert post.call_count == 2
+
+
+def test_queued_alert_is_posted_at_exit():
+    """An alert queued right before the interpreter exits is still posted."""
+    script = textwrap.dedent("""
+        from unittest import mock
+        from monitors import webhooks
+        webhooks.get_webhooks = lambda: [{"name": "all", "url": "https://example.com/all"}]
+        def post_json(url, payload, **kwargs):
+            print("POSTED", url, flush=True)
+            return mock.Mock(status_code=200)
+        webhooks.post_json = post_json
+        webhooks.WEBHOOK_BATCH_WINDOW = 0
+        webhooks.send_alert_to_webhooks("github", "A", "t", "m", [], "https://x", {})
+    """)
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT,
+                            capture_output=True, text=True, timeout=30)
+
+    assert "POSTED https://example.com/all" in result.stdout, result.stdout + result.stderr